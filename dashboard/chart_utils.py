@@ -0,0 +1,119 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Chart utility functions for Streamlit Dashboard
+Prepares data for and builds cached Plotly charts
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from config import MAX_CHART_POINTS
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    Returns the indices of the points to keep (first and last are always kept)
+    x must be numeric and sorted ascending
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (threshold - 2)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Keep the point in this bucket forming the largest triangle
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    indices[-1] = n - 1
+    return indices
+
+
+def downsample_timeseries(df, x_col, y_col, threshold=None):
+    """
+    Downsample a date-ordered DataFrame with LTTB on y_col
+    Frames at or below the threshold are returned unchanged
+    """
+    threshold = threshold or MAX_CHART_POINTS
+    if len(df) <= threshold:
+        return df
+
+    x = pd.to_datetime(df[x_col]).to_numpy(dtype="datetime64[ns]").astype("int64")
+    return df.iloc[lttb_indices(x, df[y_col].to_numpy(), threshold)]
+
+
+@st.cache_data(show_spinner=False)
+def forecast_timeline_json(forecast_df, y_col, y_label, chart_title):
+    """
+    Build the daily forecast timeline (prediction line + confidence band)
+    Returns the figure as JSON so the cached value is cheap to reuse
+    """
+    # Long horizons are downsampled before being sent to the browser
+    chart_df = downsample_timeseries(forecast_df, 'FORECAST_DATE', y_col)
+    
+    fig = go.Figure()
+    
+    # Add prediction line
+    fig.add_trace(go.Scatter(
+        x=chart_df['FORECAST_DATE'],
+        y=chart_df[y_col],
+        mode='lines+markers',
+        name=y_label,
+        line=dict(color='#3498db', width=2),
+        marker=dict(size=8)
+    ))
+    
+    # Add confidence interval (upper bound forward, lower bound back)
+    forecast_dates = chart_df['FORECAST_DATE'].to_numpy()
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([forecast_dates, forecast_dates[::-1]]),
+        y=np.concatenate([
+            chart_df['UPPER_BOUND'].to_numpy(),
+            chart_df['LOWER_BOUND'].to_numpy()[::-1]
+        ]),
+        fill='toself',
+        fillcolor='rgba(52, 152, 219, 0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name='95% Confidence Interval'
+    ))
+    
+    fig.update_layout(
+        title=chart_title,
+        xaxis_title="Date",
+        yaxis_title="Number of Failures",
+        hovermode='x unified'
+    )
+    return fig.to_json()
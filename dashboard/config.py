@@ -40,6 +40,22 @@ except (KeyError, FileNotFoundError):
         "password": os.getenv("POSTGRES_PASSWORD", "password")
     }
 
+# Pooled PostgreSQL connections for write operations (shared by all sessions)
+DB_POOL_MIN = 1
+DB_POOL_MAX = 8
+DB_STATEMENT_TIMEOUT_MS = 10000
+
+# SQLAlchemy engine pool for read queries (shared by all sessions)
+DB_ENGINE_POOL_SIZE = 10
+DB_ENGINE_MAX_OVERFLOW = 20
+DB_POOL_RECYCLE_SECONDS = 1800
+
+# Rows fetched per round trip when dashboard queries stream their results
+DB_FETCH_CHUNK_SIZE = 5000
+
+# Rows sampled (TABLESAMPLE SYSTEM_ROWS) when the demo controls pick random lights
+DEMO_SAMPLE_ROWS = 100
+
 # Snowflake Connection for ML Predictions
 # Try to load from Streamlit secrets first, fallback to defaults
 try:
@@ -78,7 +94,9 @@ PAGE_CONFIG = {
 MAP_CONFIG = {
     "center": [12.9716, 77.5946],  # Bengaluru center
     "zoom": 11,
-    "tiles": "OpenStreetMap"
+    "tiles": "OpenStreetMap",
+    # Draw vector layers (circles, polygons, lines) on one canvas instead of SVG nodes
+    "prefer_canvas": True
 }
 
 # Color Scheme for Light Status
@@ -97,9 +115,23 @@ URGENCY_COLORS = {
     "LOW": "#95a5a6"        # Gray
 }
 
+# Forecast Priority / Workload Colors
+PRIORITY_COLORS = {
+    "HIGH": "#e74c3c",      # Red
+    "MEDIUM": "#f39c12",    # Yellow/Orange
+    "LOW": "#27ae60"        # Green
+}
+
 # Refresh Interval (seconds)
 AUTO_REFRESH_INTERVAL = 30
 
 # Query Limits
 MAX_RESULTS = 1000
 
+# Chart Limits (timeseries above this are downsampled with LTTB)
+MAX_CHART_POINTS = 500
+
+# Light layers at or above this are drawn with a pydeck (WebGL) ScatterplotLayer
+# Above the 5,000 seeded lights, so the default Overview keeps the Folium map
+# (light popups, supplier service radii, fullscreen control)
+DECK_LIGHTS_THRESHOLD = 20000
@@ -17,11 +17,27 @@ Database utility functions for Streamlit Dashboard
 Handles PostgreSQL/PostGIS and Snowflake connections and queries
 """
 
+import functools
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
 import pandas as pd
-import psycopg2
 import streamlit as st
-from config import POSTGIS_CONFIG, SNOWFLAKE_CONFIG, SNOWFLAKE_ENABLED
+from config import (
+    POSTGIS_CONFIG, SNOWFLAKE_CONFIG, SNOWFLAKE_ENABLED,
+    DB_POOL_MIN, DB_POOL_MAX, DB_STATEMENT_TIMEOUT_MS, DB_FETCH_CHUNK_SIZE,
+    DB_ENGINE_POOL_SIZE, DB_ENGINE_MAX_OVERFLOW, DB_POOL_RECYCLE_SECONDS,
+    DEMO_SAMPLE_ROWS
+)
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from sqlalchemy import create_engine
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import Snowflake connector if available
 try:
@@ -32,6 +48,29 @@ except ImportError:
     sf_connector = None
     SNOWFLAKE_AVAILABLE = False
 
+# Import connectorx if available (columnar fast path for unparameterized reads)
+try:
+    import connectorx as cx
+
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    cx = None
+    CONNECTORX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def postgres_url():
+    """
+    Build the PostgreSQL connection URL from config
+    Sets search_path to streetlights,public so PostGIS operators are found
+    """
+    return (
+        f"postgresql://{POSTGIS_CONFIG['user']}:{POSTGIS_CONFIG['password']}"
+        f"@{POSTGIS_CONFIG['host']}:{POSTGIS_CONFIG['port']}/{POSTGIS_CONFIG['database']}"
+        f"?options=-csearch_path%3Dstreetlights,public"
+    )
+
 
 @st.cache_resource
 def get_sqlalchemy_engine():
@@ -40,14 +79,16 @@ def get_sqlalchemy_engine():
     Returns SQLAlchemy engine object
     """
     try:
-        # Build SQLAlchemy connection string from config
-        # Set search_path to streetlights,public so PostGIS operators are found
-        connection_string = (
-            f"postgresql://{POSTGIS_CONFIG['user']}:{POSTGIS_CONFIG['password']}"
-            f"@{POSTGIS_CONFIG['host']}:{POSTGIS_CONFIG['port']}/{POSTGIS_CONFIG['database']}"
-            f"?options=-csearch_path%3Dstreetlights,public"
+        engine = create_engine(
+            postgres_url(),
+            # Sized for concurrent reruns and load_concurrently() fan-out
+            pool_size=DB_ENGINE_POOL_SIZE,
+            max_overflow=DB_ENGINE_MAX_OVERFLOW,
+            # Drop dead or long-lived connections instead of failing a query
+            pool_pre_ping=True,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            connect_args={"application_name": "streetlights-dashboard"},
         )
-        engine = create_engine(connection_string)
         return engine
     except Exception as e:
         st.error(f"Database engine creation failed: {e}")
@@ -55,68 +96,432 @@ def get_sqlalchemy_engine():
 
 
 @st.cache_resource
-def get_connection():
+def get_connection_pool():
     """
-    Get PostgreSQL connection for write operations (cached)
-    Returns psycopg2 connection object
+    Get PostgreSQL connection pool for writes and COPY reads (cached)
+    Returns psycopg2 ThreadedConnectionPool shared by all sessions
     """
     try:
-        conn = psycopg2.connect(
+        pool = ThreadedConnectionPool(
+            DB_POOL_MIN,
+            DB_POOL_MAX,
             **POSTGIS_CONFIG,
-            options="-c search_path=streetlights,public"
+            options=(
+                "-c search_path=streetlights,public "
+                f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+            ),
         )
-        return conn
+        return pool
     except Exception as e:
         st.error(f"Database connection failed: {e}")
         return None
 
 
-def execute_query(query, params=None):
+def _checkout_live_connection(pool):
+    """
+    Take a pooled connection, discarding any that went stale while idle
+    (server restart, idle timeout) so the write does not fail on first use
+    After a restart every idle connection is dead, so up to pool.maxconn
+    are pinged and closed before a fresh one is returned
+    """
+    for _ in range(pool.maxconn):
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            pool.putconn(conn, close=True)
+    # Every idle connection was stale; the pool now opens a new one
+    return pool.getconn()
+
+
+@contextmanager
+def get_connection():
+    """
+    Borrow a PostgreSQL connection from the pool for one operation
+    Yields None if the pool is unavailable. On return the pool rolls back
+    unfinished transactions and discards lost connections
+    """
+    pool = get_connection_pool()
+    if pool is None:
+        yield None
+        return
+
+    conn = _checkout_live_connection(pool)
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+# connectorx state: switched off for the process after its first failure
+_connectorx = {"enabled": CONNECTORX_AVAILABLE, "verified": False}
+
+
+def _read_sql_connectorx(query):
+    """
+    Run a query through connectorx and return a DataFrame typed like the
+    SQLAlchemy path (DATE columns as date objects, timestamps as datetime64)
+    """
+    table = cx.read_sql(postgres_url(), query, return_type="arrow")
+    return table.to_pandas(date_as_object=True)
+
+
+def _try_connectorx(query):
+    """
+    Read an unparameterized query through connectorx (Arrow transfer)
+    Returns None when connectorx is not installed or has been disabled
+    """
+    if not _connectorx["enabled"]:
+        return None
+
+    try:
+        if not _connectorx["verified"]:
+            # The dashboard queries use unqualified table names, so the
+            # search_path option in the URL must reach the server
+            path = _read_sql_connectorx("SELECT current_setting('search_path') AS search_path")
+            if "streetlights" not in path["search_path"].iloc[0]:
+                raise RuntimeError(f"search_path option ignored ({path['search_path'].iloc[0]})")
+            _connectorx["verified"] = True
+        return _read_sql_connectorx(query)
+    except Exception as e:
+        _connectorx["enabled"] = False
+        logger.warning("connectorx disabled, using SQLAlchemy for all reads: %s", e)
+        return None
+
+
+def execute_query(query, params=None, chunksize=DB_FETCH_CHUNK_SIZE):
     """
     Execute SQL query and return DataFrame using SQLAlchemy engine
+    Rows are streamed from a server-side cursor in chunks of chunksize
+    Unparameterized queries use connectorx (Arrow transfer) when installed
     """
+    if not params:
+        df = _try_connectorx(query)
+        if df is not None:
+            return df
+
     engine = get_sqlalchemy_engine()
     if engine is None:
         return pd.DataFrame()
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(query, conn, params=params)
+        with engine.connect().execution_options(stream_results=True) as conn:
+            chunks = pd.read_sql_query(query, conn, params=params, chunksize=chunksize)
+            df = pd.concat(chunks, ignore_index=True)
         return df
     except Exception as e:
         st.error(f"Query failed: {e}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def get_all_lights():
-    """Get all street lights with enrichment"""
-    query = """
-    SELECT 
+def execute_query_copy(query, params=None, dtype=None, parse_dates=None):
+    """
+    Execute a read-only SQL query through COPY ... TO STDOUT and return a DataFrame
+    Rows arrive as one CSV stream parsed by pandas, skipping per-row DB-API
+    tuples; CSV carries no types, so callers pass the column dtype and
+    parse_dates for pandas.read_csv
+    """
+    with get_connection() as conn:
+        if conn is None:
+            return pd.DataFrame()
+
+        try:
+            buf = io.BytesIO()
+            with conn.cursor() as cursor:
+                # COPY takes no bind parameters, so they are inlined by mogrify
+                sql = cursor.mogrify(query, params).decode()
+                cursor.copy_expert(f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER true)", buf)
+            conn.rollback()
+            buf.seek(0)
+            return pd.read_csv(buf, dtype=dtype, parse_dates=parse_dates)
+        except Exception as e:
+            st.error(f"Query failed: {e}")
+            return pd.DataFrame()
+
+
+def load_concurrently(**loaders):
+    """
+    Run independent loader functions in parallel threads
+    Returns a dict of results keyed like the arguments
+    """
+    ctx = get_script_run_ctx()
+
+    def run(loader):
+        # Let cached loaders and st.error work from the worker thread
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return loader()
+
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {name: executor.submit(run, loader) for name, loader in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def swr_cache(fresh, stale, on_error=None):
+    """
+    Stale-while-revalidate cache shared by all sessions
+    Values up to fresh seconds old are served as is; values up to fresh + stale
+    seconds old are served immediately while one background thread refetches them
+    Values are shared between sessions, so callers must not mutate them
+    Failures are never cached: on_error(error, *args, **kwargs) supplies the
+    fallback value, and a failed background refresh keeps the stale value
+    """
+    def decorator(func):
+        entries = {}
+        refreshing = set()
+        lock = threading.Lock()
+
+        def store(key, args, kwargs):
+            value = func(*args, **kwargs)
+            with lock:
+                entries[key] = (value, time.monotonic())
+            return value
+
+        def load(key, args, kwargs):
+            try:
+                return store(key, args, kwargs)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                return on_error(e, *args, **kwargs)
+
+        def refresh(key, args, kwargs, ctx):
+            # Let cached resources work from the refresh thread
+            add_script_run_ctx(threading.current_thread(), ctx)
+            try:
+                store(key, args, kwargs)
+            except Exception:
+                # Keep serving the stale value; the next stale hit retries
+                pass
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            with lock:
+                entry = entries.get(key)
+            if entry is None:
+                return load(key, args, kwargs)
+
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age >= fresh + stale:
+                return load(key, args, kwargs)
+            if age >= fresh:
+                with lock:
+                    start = key not in refreshing
+                    refreshing.add(key)
+                if start:
+                    threading.Thread(
+                        target=refresh,
+                        args=(key, args, kwargs, get_script_run_ctx()),
+                        daemon=True,
+                    ).start()
+            return value
+
+        def clear():
+            with lock:
+                entries.clear()
+
+        wrapper.clear = clear
+        return wrapper
+
+    return decorator
+
+
+def _compact(df, categories=(), floats=(), ints=(), downcast=False):
+    """
+    Downcast query result columns to compact dtypes
+    Low-cardinality strings become category, measures become float32/int32
+    With downcast=True every other float64/int64 column is narrowed as well
+    """
+    if df.empty:
+        return df
+
+    for col in categories:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in floats:
+        if col in df.columns:
+            df[col] = df[col].astype("float32")
+    for col in ints:
+        if col in df.columns and not df[col].isna().any():
+            df[col] = df[col].astype("int32")
+    if downcast:
+        for col in df.select_dtypes("float64").columns:
+            df[col] = df[col].astype("float32")
+        for col in df.select_dtypes("int64").columns:
+            # int32 rather than the smallest fit, so arithmetic cannot overflow
+            if df[col].abs().max() <= np.iinfo(np.int32).max:
+                df[col] = df[col].astype("int32")
+    return df
+
+
+def _metric_text(value):
+    """
+    Format a forecast metric for the dashboard cards
+    """
+    value = float(value)
+    return str(int(value)) if value.is_integer() else f"{value:.2f}"
+
+
+def _forecast_metrics(forecast_df, forecast_type, today):
+    """
+    Derive the forecast metric cards from the already-fetched 30-day forecast
+    today is Snowflake's CURRENT_DATE, fetched with the forecast
+    Returns a METRIC -> VALUE Series (empty if there is no forecast)
+    """
+    if forecast_df.empty:
+        return pd.Series(dtype=object)
+
+    next_7_days = pd.to_datetime(forecast_df["FORECAST_DATE"]) <= (
+        pd.Timestamp(today) + pd.Timedelta(days=7)
+    )
+    if forecast_type == "bulb":
+        failures = forecast_df["PREDICTED_FAILURES"]
+        values = {
+            "FORECAST_NEXT_7_DAYS": failures[next_7_days].sum(),
+            "FORECAST_NEXT_30_DAYS": failures.sum(),
+            "HIGH_PRIORITY_DAYS": (forecast_df["PRIORITY"] == "HIGH").sum(),
+            "BULBS_TO_ORDER_30D": forecast_df["BULBS_TO_STOCK"].sum(),
+        }
+    else:
+        requests = forecast_df["PREDICTED_REQUESTS"]
+        values = {
+            "TOTAL_REQUESTS_NEXT_7_DAYS": requests[next_7_days].sum(),
+            "TOTAL_REQUESTS_NEXT_30_DAYS": requests.sum(),
+            "HIGH_WORKLOAD_DAYS": (forecast_df["WORKLOAD_LEVEL"] == "HIGH").sum(),
+            "TOTAL_PARTS_NEEDED": forecast_df[
+                ["BULBS_TO_STOCK", "WIRING_KITS_TO_STOCK", "POLES_TO_STOCK"]
+            ].to_numpy().sum(),
+        }
+    return pd.Series({k: _metric_text(v) for k, v in values.items()}, dtype=object)
+
+
+def refresh_enriched_snapshot(force=False):
+    """
+    Re-snapshot mv_street_lights_enriched
+    Season, age and urgency in the snapshot are relative to its snapshot_date,
+    so without force this is a no-op unless the day has changed
+    Called at session start and from the Refresh All Data control
+    """
+    with get_connection() as conn:
+        if conn is None:
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT streetlights.refresh_enriched_lights(%s)", (force,))
+            conn.commit()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+
+# Columns read by map_utils.add_lights_layer (markers, tooltips and popups)
+MAP_LIGHT_COLUMNS = """
         light_id, longitude, latitude, status,
-        neighborhood_name, wattage,
-        season, failure_risk_score, predicted_failure_date,
-        maintenance_urgency, age_months, days_since_maintenance
-    FROM streetlights.street_lights_enriched
+        neighborhood_name, wattage, age_months,
+        failure_risk_score, predicted_failure_date"""
+
+# Types of MAP_LIGHT_COLUMNS for COPY (CSV) reads
+MAP_LIGHT_DTYPES = {
+    "light_id": "str",
+    "longitude": "float64",
+    "latitude": "float64",
+    "status": "category",
+    "neighborhood_name": "category",
+    "wattage": "Int32",
+    "age_months": "float64",
+    "failure_risk_score": "float64",
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_lights_map(neighborhoods=None):
+    """
+    Get street lights with only the columns the map layer renders
+    Optionally limited to the given neighborhood names (filtered in PostGIS)
+    """
+    where = ""
+    params = {}
+    if neighborhoods:
+        where = "WHERE neighborhood_name = ANY(%(neighborhoods)s)"
+        params["neighborhoods"] = list(neighborhoods)
+
+    query = f"""
+    SELECT {MAP_LIGHT_COLUMNS}
+    FROM streetlights.mv_street_lights_enriched
+    {where}
     ORDER BY light_id
     """
+    df = execute_query_copy(
+        query, params or None,
+        dtype=MAP_LIGHT_DTYPES, parse_dates=["predicted_failure_date"],
+    )
+    return _compact(df, downcast=True)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_sample_lights(n=500):
+    """
+    Get a fixed sample of n street lights with enrichment
+    Sampled in PostGIS by a stable hash of light_id so the map does not flicker
+    """
+    query = f"""
+    SELECT {MAP_LIGHT_COLUMNS}
+    FROM streetlights.mv_street_lights_enriched
+    WHERE light_id IN (
+        SELECT light_id FROM streetlights.street_lights
+        ORDER BY md5(light_id)
+        LIMIT %(n)s
+    )
+    """
+    return _compact(
+        execute_query(query, {"n": int(n)}),
+        categories=("status", "neighborhood_name"),
+        downcast=True,
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_status_counts():
+    """
+    Get light counts by status as a single row
+    Columns: total, operational, faulty, maintenance_required
+    """
+    query = """
+    SELECT 
+        COUNT(*) as total,
+        COUNT(*) FILTER (WHERE status = 'operational') as operational,
+        COUNT(*) FILTER (WHERE status = 'faulty') as faulty,
+        COUNT(*) FILTER (WHERE status = 'maintenance_required') as maintenance_required
+    FROM streetlights.street_lights
+    """
     return execute_query(query)
 
 
-@st.cache_data(ttl=60)
+# Boundaries are static reference data, so the result is persisted to disk
+# and survives restarts (persisted caches have no TTL; "Refresh All Data" clears it)
+@st.cache_data(persist="disk", show_spinner=False)
 def get_neighborhoods():
     """Get all neighborhoods with boundaries"""
     query = """
     SELECT 
         neighborhood_id, name, population,
-        ST_AsGeoJSON(boundary) as boundary_geojson
+        -- Generated column, serialized once when the boundary is written
+        boundary_geojson
     FROM streetlights.neighborhoods
     ORDER BY name
     """
-    return execute_query(query)
+    return _compact(execute_query(query), downcast=True)
 
 
-@st.cache_data(ttl=60)
+@st.cache_data(ttl=60, show_spinner=False)
 def get_suppliers():
     """Get all suppliers"""
     query = """
@@ -129,83 +534,144 @@ def get_suppliers():
     FROM streetlights.suppliers
     ORDER BY name
     """
+    return _compact(execute_query(query), categories=("specialization",), downcast=True)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_supplier_specialization_counts():
+    """Get supplier counts per specialization"""
+    query = """
+    SELECT specialization, COUNT(*) as count
+    FROM streetlights.suppliers
+    GROUP BY specialization
+    ORDER BY count DESC
+    """
     return execute_query(query)
 
 
-@st.cache_data(ttl=30)
-def get_faulty_lights_with_supplier():
-    """Get faulty lights with nearest supplier"""
+@st.cache_data(ttl=300, show_spinner=False)
+def get_supplier_radius_histogram(bucket_km=5):
+    """
+    Get supplier counts per service radius bucket
+    Buckets are bucket_km wide and labelled by their lower bound
+    """
     query = """
     SELECT 
-        l.light_id,
-        ST_X(l.location) as longitude,
-        ST_Y(l.location) as latitude,
-        l.status,
-        n.name as neighborhood,
-        s.name as nearest_supplier,
-        s.specialization,
-        ROUND(
-            ST_Distance(s.location::geography, l.location::geography)::numeric / 1000, 
-            2
-        ) as distance_km,
-        s.avg_response_hours,
-        s.contact_phone
-    FROM streetlights.street_lights l
-    LEFT JOIN streetlights.neighborhoods n ON l.neighborhood_id = n.neighborhood_id
-    CROSS JOIN LATERAL (
-        SELECT supplier_id, name, specialization, location, avg_response_hours, contact_phone
-        FROM streetlights.suppliers
-        ORDER BY location <-> l.location
-        LIMIT 1
-    ) s
-    WHERE l.status = 'faulty'
+        (service_radius_km / %(bucket_km)s) * %(bucket_km)s as radius_from_km,
+        COUNT(*) as suppliers
+    FROM streetlights.suppliers
+    WHERE service_radius_km IS NOT NULL
+    GROUP BY radius_from_km
+    ORDER BY radius_from_km
+    """
+    return execute_query(query, {"bucket_km": int(bucket_km)})
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_faulty_lights_with_supplier(neighborhoods=None, max_distance_km=None):
+    """
+    Get faulty lights with nearest supplier
+    Read from the mv_faulty_lights_with_supplier materialized view
+    Optional neighborhood and distance filters are applied in PostGIS
+    """
+    filters = []
+    params = {}
+    if neighborhoods:
+        filters.append("neighborhood = ANY(%(neighborhoods)s)")
+        params["neighborhoods"] = list(neighborhoods)
+    if max_distance_km is not None:
+        filters.append("distance_km <= %(max_distance_km)s")
+        params["max_distance_km"] = max_distance_km
+    where = ("WHERE " + "\n      AND ".join(filters)) if filters else ""
+
+    query = f"""
+    SELECT 
+        light_id, longitude, latitude, status,
+        neighborhood, nearest_supplier, specialization,
+        distance_km, avg_response_hours, contact_phone
+    FROM streetlights.mv_faulty_lights_with_supplier
+    {where}
     ORDER BY distance_km
     """
-    return execute_query(query)
+    return _compact(
+        execute_query(query, params or None),
+        categories=("status", "neighborhood", "specialization"),
+        floats=("longitude", "latitude", "distance_km"),
+        ints=("avg_response_hours",),
+    )
 
 
-@st.cache_data(ttl=60)
-def get_predicted_failures(days_ahead=30):
-    """Get lights predicted to fail soon"""
-    query = (
-        """
+def _prediction_filters(days_ahead, urgencies):
+    """
+    WHERE clause and params shared by the predicted failure queries
+    """
+    filters = [
+        "predicted_failure_date IS NOT NULL",
+        # date + integer stays a DATE, matching the predicted_failure_date index
+        "predicted_failure_date <= CURRENT_DATE + %(days_ahead)s",
+        "status != 'faulty'",
+    ]
+    params = {"days_ahead": int(days_ahead)}
+    if urgencies:
+        filters.append("maintenance_urgency = ANY(%(urgencies)s)")
+        params["urgencies"] = sorted(urgencies)
+    return "\n      AND ".join(filters), params
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_predicted_failures(days_ahead=30, urgencies=None):
+    """
+    Get lights predicted to fail soon
+    Optionally limited to the given maintenance urgencies (filtered in PostGIS)
+    """
+    where, params = _prediction_filters(days_ahead, urgencies)
+    query = f"""
     SELECT 
         light_id, longitude, latitude, status,
         neighborhood_name, 
         predicted_failure_date,
         failure_risk_score,
         maintenance_urgency,
-        age_months, days_since_maintenance,
         season
-    FROM streetlights.street_lights_enriched
-    WHERE predicted_failure_date IS NOT NULL
-      AND predicted_failure_date <= CURRENT_DATE + INTERVAL '%s days'
-      AND status != 'faulty'
+    FROM streetlights.mv_street_lights_enriched
+    WHERE {where}
     ORDER BY predicted_failure_date
     """
-        % days_ahead
+    return _compact(
+        execute_query(query, params),
+        categories=("status", "neighborhood_name", "maintenance_urgency", "season"),
+        downcast=True,
     )
-    return execute_query(query)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_prediction_timeline(days_ahead=30, urgencies=None):
+    """
+    Get the number of predicted failures per day (aggregated in PostGIS)
+    Same filters as get_predicted_failures
+    """
+    where, params = _prediction_filters(days_ahead, urgencies)
+    query = f"""
+    SELECT predicted_failure_date, COUNT(*) as count
+    FROM streetlights.mv_street_lights_enriched
+    WHERE {where}
+    GROUP BY predicted_failure_date
+    ORDER BY predicted_failure_date
+    """
+    return execute_query(query, params)
 
 
 @st.cache_data(ttl=120)
 def get_neighborhood_stats():
-    """Get aggregated stats per neighborhood"""
+    """
+    Get aggregated stats per neighborhood
+    Read from the mv_neighborhood_stats materialized view
+    """
     query = """
     SELECT 
-        n.name as neighborhood,
-        COUNT(l.light_id) as total_lights,
-        COUNT(CASE WHEN l.status = 'operational' THEN 1 END) as operational,
-        COUNT(CASE WHEN l.status = 'maintenance_required' THEN 1 END) as maintenance_required,
-        COUNT(CASE WHEN l.status = 'faulty' THEN 1 END) as faulty,
-        ROUND(
-            COUNT(CASE WHEN l.status = 'faulty' THEN 1 END) * 100.0 / 
-            NULLIF(COUNT(l.light_id), 0), 
-            2
-        ) as faulty_percentage
-    FROM streetlights.neighborhoods n
-    LEFT JOIN streetlights.street_lights l ON ST_Within(l.location, n.boundary)
-    GROUP BY n.name
+        neighborhood, total_lights, operational,
+        maintenance_required, faulty, faulty_percentage
+    FROM streetlights.mv_neighborhood_stats
     ORDER BY faulty DESC, total_lights DESC
     """
     return execute_query(query)
@@ -213,15 +679,13 @@ def get_neighborhood_stats():
 
 @st.cache_data(ttl=120)
 def get_seasonal_patterns():
-    """Get maintenance patterns by season"""
+    """
+    Get maintenance patterns by season
+    Read from the mv_seasonal_patterns materialized view
+    """
     query = """
-    SELECT 
-        season,
-        COUNT(*) as request_count,
-        AVG(resolution_hours) as avg_resolution_hours
-    FROM streetlights.maintenance_requests_enriched
-    WHERE resolved_at IS NOT NULL
-    GROUP BY season
+    SELECT season, request_count, avg_resolution_hours
+    FROM streetlights.mv_seasonal_patterns
     ORDER BY CASE season
         WHEN 'monsoon' THEN 1
         WHEN 'summer' THEN 2
@@ -231,158 +695,196 @@ def get_seasonal_patterns():
     return execute_query(query)
 
 
-@st.cache_data(ttl=60)
+@st.cache_data(ttl=60, show_spinner=False)
 def get_supplier_coverage():
-    """Analyze supplier coverage"""
+    """
+    Analyze supplier coverage
+    Aggregates the precomputed light_nearest_supplier distances
+    """
     query = """
-    WITH light_supplier_distance AS (
-        SELECT 
-            l.light_id,
-            MIN(ST_Distance(s.location::geography, l.location::geography) / 1000) as nearest_supplier_km
-        FROM streetlights.street_lights l
-        CROSS JOIN streetlights.suppliers s
-        GROUP BY l.light_id
-    )
     SELECT 
         COUNT(*) as total_lights,
-        COUNT(CASE WHEN nearest_supplier_km <= 5 THEN 1 END) as within_5km,
-        COUNT(CASE WHEN nearest_supplier_km <= 10 THEN 1 END) as within_10km,
-        COUNT(CASE WHEN nearest_supplier_km > 10 THEN 1 END) as beyond_10km,
-        ROUND(AVG(nearest_supplier_km)::numeric, 2) as avg_distance_km
-    FROM light_supplier_distance
+        COUNT(*) FILTER (WHERE distance_km <= 5) as within_5km,
+        COUNT(*) FILTER (WHERE distance_km <= 10) as within_10km,
+        COUNT(*) FILTER (WHERE distance_km > 10) as beyond_10km,
+        ROUND(AVG(distance_km)::numeric, 2) as avg_distance_km
+    FROM streetlights.light_nearest_supplier
     """
     return execute_query(query)
 
 
 @st.cache_data(ttl=60)
 def get_neighborhood_supplier_distance():
-    """Get distance from each neighborhood center to nearest supplier"""
+    """
+    Get distance from each neighborhood center to nearest supplier
+    Uses the stored neighborhoods.center column and the light counts
+    already kept in mv_neighborhood_stats
+    """
     query = """
-    WITH neighborhood_centers AS (
-        SELECT 
-            neighborhood_id,
-            name,
-            ST_Centroid(boundary) as center
-        FROM streetlights.neighborhoods
-    ),
-    neighborhood_supplier_dist AS (
-        SELECT 
-            nc.neighborhood_id,
-            nc.name,
-            s.name as nearest_supplier,
-            s.specialization,
-            ROUND(
-                MIN(ST_Distance(nc.center::geography, s.location::geography))::numeric / 1000,
-                2
-            ) as distance_km
-        FROM neighborhood_centers nc
-        CROSS JOIN streetlights.suppliers s
-        GROUP BY nc.neighborhood_id, nc.name, s.name, s.specialization
-    )
     SELECT 
-        nsd.name as neighborhood,
-        nsd.nearest_supplier,
-        nsd.specialization,
-        nsd.distance_km,
-        COUNT(l.light_id) as lights_in_neighborhood
-    FROM neighborhood_supplier_dist nsd
-    JOIN streetlights.neighborhoods n ON nsd.neighborhood_id = n.neighborhood_id
-    LEFT JOIN streetlights.street_lights l ON ST_Within(l.location, n.boundary)
-    WHERE nsd.distance_km = (
-        SELECT MIN(distance_km)
-        FROM neighborhood_supplier_dist
-        WHERE neighborhood_id = nsd.neighborhood_id
-    )
-    GROUP BY nsd.neighborhood_id, nsd.name, nsd.nearest_supplier, nsd.specialization, nsd.distance_km
-    ORDER BY nsd.distance_km DESC
+        n.name as neighborhood,
+        s.name as nearest_supplier,
+        s.specialization,
+        ROUND(
+            ST_Distance(n.center, s.location_geog)::numeric / 1000,
+            2
+        ) as distance_km,
+        ns.total_lights as lights_in_neighborhood
+    FROM streetlights.neighborhoods n
+    JOIN streetlights.mv_neighborhood_stats ns ON ns.neighborhood = n.name
+    CROSS JOIN LATERAL (
+        SELECT name, specialization, location_geog
+        FROM streetlights.suppliers
+        ORDER BY location_geog <-> n.center
+        LIMIT 1
+    ) s
+    ORDER BY distance_km DESC
     """
     return execute_query(query)
 
 
+# Materialized views that depend on light status (see init/05_create_enriched_views.sql)
+REFRESH_STATUS_VIEWS = """
+REFRESH MATERIALIZED VIEW CONCURRENTLY streetlights.mv_neighborhood_stats;
+REFRESH MATERIALIZED VIEW CONCURRENTLY streetlights.mv_faulty_lights_with_supplier;
+REFRESH MATERIALIZED VIEW CONCURRENTLY streetlights.mv_street_lights_enriched;
+"""
+
+
+def clear_light_status_caches():
+    """
+    Invalidate only the cached queries that read street light status
+    Neighborhoods, suppliers and coverage distances stay warm after a write
+    """
+    for cached in (
+        get_lights_map,
+        get_sample_lights,
+        get_status_counts,
+        get_faulty_lights_with_supplier,
+        get_predicted_failures,
+        get_prediction_timeline,
+        get_neighborhood_stats,
+    ):
+        cached.clear()
+
+
 def simulate_light_failure(light_id=None):
     """
     Simulate a light failure for demo purposes
     If no light_id provided, pick a random operational light
     """
-    conn = get_connection()
-    if conn is None:
-        return False, "No database connection"
-
-    try:
-        cursor = conn.cursor()
-
-        if light_id is None:
-            # Pick random operational light
-            cursor.execute("""
-                SELECT light_id FROM streetlights.street_lights 
-                WHERE status = 'operational' 
-                ORDER BY RANDOM() 
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            if result:
-                light_id = result[0]
-            else:
-                return False, "No operational lights found"
-
-        # Update light to faulty
-        cursor.execute(
-            """
-            UPDATE streetlights.street_lights
-            SET status = 'faulty', last_maintenance = NOW()
-            WHERE light_id = %s
-        """,
-            (light_id,),
-        )
+    with get_connection() as conn:
+        if conn is None:
+            return False, "No database connection"
+
+        try:
+            cursor = conn.cursor()
+
+            if light_id is None:
+                # Pick random operational light from a small block sample
+                cursor.execute(
+                    """
+                    SELECT light_id FROM streetlights.street_lights
+                    TABLESAMPLE SYSTEM_ROWS(%s)
+                    WHERE status = 'operational'
+                    LIMIT 1
+                """,
+                    (DEMO_SAMPLE_ROWS,),
+                )
+                result = cursor.fetchone()
+                if result is None:
+                    # Sample held no operational light; draw from all of them instead
+                    cursor.execute("""
+                        SELECT light_id FROM streetlights.street_lights
+                        WHERE status = 'operational'
+                        ORDER BY RANDOM()
+                        LIMIT 1
+                    """)
+                    result = cursor.fetchone()
+                if result:
+                    light_id = result[0]
+                else:
+                    return False, "No operational lights found"
+
+            # Update light to faulty
+            cursor.execute(
+                """
+                UPDATE streetlights.street_lights
+                SET status = 'faulty', last_maintenance = NOW()
+                WHERE light_id = %s
+            """,
+                (light_id,),
+            )
+            cursor.execute(REFRESH_STATUS_VIEWS)
 
-        conn.commit()
-        cursor.close()
+            conn.commit()
+            cursor.close()
 
-        # Clear cache to show updated data
-        st.cache_data.clear()
+            # Clear status caches to show updated data
+            clear_light_status_caches()
 
-        return True, f"Light {light_id} set to faulty"
+            return True, f"Light {light_id} set to faulty"
 
-    except Exception as e:
-        return False, f"Failed to simulate failure: {e}"
+        except Exception as e:
+            return False, f"Failed to simulate failure: {e}"
 
 
 def trigger_scheduled_maintenance(count=5):
     """
     Set random operational lights to maintenance_required status
     """
-    conn = get_connection()
-    if conn is None:
-        return False, "No database connection"
+    with get_connection() as conn:
+        if conn is None:
+            return False, "No database connection"
+
+        try:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                UPDATE streetlights.street_lights
+                SET status = 'maintenance_required'
+                WHERE light_id IN (
+                    -- Oversample so enough rows survive the status filter
+                    SELECT light_id FROM streetlights.street_lights
+                    TABLESAMPLE SYSTEM_ROWS(%s)
+                    WHERE status = 'operational'
+                    LIMIT %s
+                )
+            """,
+                (max(DEMO_SAMPLE_ROWS, count * 10), count),
+            )
 
-    try:
-        cursor = conn.cursor()
+            affected = cursor.rowcount
 
-        cursor.execute(
-            """
-            UPDATE streetlights.street_lights
-            SET status = 'maintenance_required'
-            WHERE light_id IN (
-                SELECT light_id FROM streetlights.street_lights 
-                WHERE status = 'operational' 
-                ORDER BY RANDOM() 
-                LIMIT %s
-            )
-        """,
-            (count,),
-        )
+            if affected < count:
+                # Sample ran short (few operational lights left); top up from all of them
+                cursor.execute(
+                    """
+                    UPDATE streetlights.street_lights
+                    SET status = 'maintenance_required'
+                    WHERE light_id IN (
+                        SELECT light_id FROM streetlights.street_lights
+                        WHERE status = 'operational'
+                        ORDER BY RANDOM()
+                        LIMIT %s
+                    )
+                """,
+                    (count - affected,),
+                )
+                affected += cursor.rowcount
 
-        affected = cursor.rowcount
-        conn.commit()
-        cursor.close()
+            cursor.execute(REFRESH_STATUS_VIEWS)
+            conn.commit()
+            cursor.close()
 
-        # Clear cache
-        st.cache_data.clear()
+            # Clear status caches
+            clear_light_status_caches()
 
-        return True, f"{affected} lights set to maintenance_required"
+            return True, f"{affected} lights set to maintenance_required"
 
-    except Exception as e:
-        return False, f"Failed to trigger maintenance: {e}"
+        except Exception as e:
+            return False, f"Failed to trigger maintenance: {e}"
 
 
 # =============================================================================
@@ -420,6 +922,19 @@ def get_snowflake_connection():
         return None
 
 
+def _fetch_snowflake_frame(cursor):
+    """
+    Fetch a Snowflake cursor's results as a DataFrame
+    Uses the connector's Arrow batches when available, row tuples otherwise
+    """
+    try:
+        return cursor.fetch_pandas_all()
+    except Exception:
+        # Arrow support missing (no pyarrow) or a non-SELECT result
+        columns = [desc[0] for desc in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+
 def execute_snowflake_query(query, params=None):
     """
     Execute SQL query on Snowflake and return DataFrame
@@ -435,32 +950,55 @@ def execute_snowflake_query(query, params=None):
         else:
             cursor.execute(query)
 
-        # Fetch all results
-        columns = [desc[0] for desc in cursor.description]
-        data = cursor.fetchall()
+        df = _fetch_snowflake_frame(cursor)
         cursor.close()
 
-        return pd.DataFrame(data, columns=columns)
+        return df
     except Exception as e:
         st.error(f"Snowflake query failed: {e}")
         return pd.DataFrame()
 
 
-def is_snowflake_available():
-    """Check if Snowflake connection is available and working"""
-    return (
-        SNOWFLAKE_AVAILABLE
-        and SNOWFLAKE_ENABLED
-        and get_snowflake_connection() is not None
-    )
+def _run_snowflake_queries(queries):
+    """
+    Execute several SQL statements on Snowflake as one multi-statement query
+    The script is submitted in a single request; each statement's result set
+    is then read from the same cursor
+    Returns a list of DataFrames in statement order; raises on failure
+    """
+    conn = get_snowflake_connection()
+    if conn is None:
+        raise RuntimeError("Snowflake connection is not available")
 
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            ";\n".join(q.strip() for q in queries),
+            num_statements=len(queries),
+        )
+        results = [_fetch_snowflake_frame(cursor)]
+        while cursor.nextset():
+            results.append(_fetch_snowflake_frame(cursor))
+        return results
+    finally:
+        cursor.close()
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_snowflake_forecast_30d():
+
+def is_snowflake_available():
     """
-    Get 30-day bulb failure forecast from Snowflake ML model
+    Check if Snowflake is installed and enabled (no connection is opened)
+    The connection is created lazily by the first query; connect errors
+    are reported there
     """
-    query = """
+    return SNOWFLAKE_AVAILABLE and SNOWFLAKE_ENABLED
+
+
+# =============================================================================
+# SNOWFLAKE FORECAST QUERIES
+# =============================================================================
+
+
+SF_FORECAST_30D_QUERY = """
     SELECT 
         FORECAST_DATE,
         PREDICTED_FAILURES,
@@ -473,36 +1011,10 @@ def get_snowflake_forecast_30d():
         BULBS_TO_STOCK
     FROM BULB_REPLACEMENT_SCHEDULE
     ORDER BY FORECAST_DATE
-    """
-    return execute_snowflake_query(query)
-
-
-@st.cache_data(ttl=300)
-def get_snowflake_forecast_90d():
-    """
-    Get 90-day bulb failure forecast from Snowflake ML model
-    """
-    query = """
-    SELECT 
-        FORECAST_DATE,
-        PREDICTED_FAILURES,
-        LOWER_BOUND,
-        UPPER_BOUND,
-        WEEK_START,
-        MONTH_START,
-        SEASON
-    FROM BULB_FAILURE_FORECAST_90D
-    ORDER BY FORECAST_DATE
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_weekly_forecast():
-    """
-    Get weekly forecast summary from Snowflake
-    """
-    query = """
+SF_WEEKLY_FORECAST_QUERY = """
     SELECT 
         WEEK_START,
         TOTAL_PREDICTED_FAILURES,
@@ -513,47 +1025,10 @@ def get_snowflake_weekly_forecast():
         PRIMARY_SEASON
     FROM WEEKLY_BULB_FORECAST
     ORDER BY WEEK_START
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_forecast_metrics():
-    """
-    Get key forecast metrics for dashboard cards from Snowflake
-    """
-    query = """
-    SELECT 
-        'FORECAST_NEXT_7_DAYS' AS metric,
-        SUM(PREDICTED_FAILURES)::VARCHAR AS value,
-        'Expected bulb failures in next 7 days' AS description
-    FROM BULB_REPLACEMENT_SCHEDULE
-    WHERE FORECAST_DATE <= DATEADD('day', 7, CURRENT_DATE())
-    
-    UNION ALL
-    
-    SELECT 'FORECAST_NEXT_30_DAYS', SUM(PREDICTED_FAILURES)::VARCHAR, 'Expected bulb failures in next 30 days'
-    FROM BULB_REPLACEMENT_SCHEDULE
-    
-    UNION ALL
-    
-    SELECT 'HIGH_PRIORITY_DAYS', COUNT(*)::VARCHAR, 'Days requiring extra staffing (next 30 days)'
-    FROM BULB_REPLACEMENT_SCHEDULE WHERE PRIORITY = 'HIGH'
-    
-    UNION ALL
-    
-    SELECT 'BULBS_TO_ORDER_30D', SUM(BULBS_TO_STOCK)::VARCHAR, 'Recommended bulb inventory for next 30 days'
-    FROM BULB_REPLACEMENT_SCHEDULE
-    """
-    return execute_snowflake_query(query)
-
-
-@st.cache_data(ttl=300)
-def get_snowflake_seasonal_forecast():
-    """
-    Get seasonal risk comparison from Snowflake
-    """
-    query = """
+SF_SEASONAL_FORECAST_QUERY = """
     SELECT 
         SEASON,
         COUNT(*) AS FORECAST_DAYS,
@@ -568,16 +1043,10 @@ def get_snowflake_seasonal_forecast():
     FROM BULB_FAILURE_FORECAST_90D
     GROUP BY SEASON
     ORDER BY AVG_DAILY_FAILURES DESC
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_monthly_budget():
-    """
-    Get monthly budget forecast from Snowflake
-    """
-    query = """
+SF_MONTHLY_BUDGET_QUERY = """
     WITH forecast_costs AS (
         SELECT 
             DATE_TRUNC('month', FORECAST_DATE)::DATE AS MONTH,
@@ -600,21 +1069,10 @@ def get_snowflake_monthly_budget():
         (PREDICTED_FAILURES * 100) AS TOTAL_MONTHLY_BUDGET_INR
     FROM forecast_costs
     ORDER BY MONTH
-    """
-    return execute_snowflake_query(query)
-
-
-# =============================================================================
-# ALL ISSUES FORECAST QUERIES (Total Maintenance Workload)
-# =============================================================================
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_all_issues_forecast_30d():
-    """
-    Get 30-day all issues (total maintenance) forecast from Snowflake ML model
-    """
-    query = """
+SF_ALL_ISSUES_FORECAST_30D_QUERY = """
     SELECT 
         FORECAST_DATE,
         PREDICTED_REQUESTS,
@@ -630,36 +1088,10 @@ def get_snowflake_all_issues_forecast_30d():
         UNCERTAINTY_RANGE
     FROM MAINTENANCE_SCHEDULE
     ORDER BY FORECAST_DATE
-    """
-    return execute_snowflake_query(query)
-
-
-@st.cache_data(ttl=300)
-def get_snowflake_all_issues_forecast_90d():
-    """
-    Get 90-day all issues forecast from Snowflake ML model
-    """
-    query = """
-    SELECT 
-        FORECAST_DATE,
-        PREDICTED_REQUESTS,
-        LOWER_BOUND,
-        UPPER_BOUND,
-        WEEK_START,
-        MONTH_START,
-        SEASON
-    FROM ALL_ISSUES_FORECAST_90D
-    ORDER BY FORECAST_DATE
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_weekly_all_issues_forecast():
-    """
-    Get weekly all issues forecast summary from Snowflake
-    """
-    query = """
+SF_WEEKLY_ALL_ISSUES_FORECAST_QUERY = """
     SELECT 
         WEEK_START,
         TOTAL_PREDICTED_REQUESTS,
@@ -670,16 +1102,10 @@ def get_snowflake_weekly_all_issues_forecast():
         PRIMARY_SEASON
     FROM WEEKLY_MAINTENANCE_FORECAST
     ORDER BY WEEK_START
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_forecast_comparison():
-    """
-    Get comparison between bulb failures and all issues forecast
-    """
-    query = """
+SF_FORECAST_COMPARISON_QUERY = """
     SELECT 
         FORECAST_DATE,
         BULB_FAILURES,
@@ -690,49 +1116,10 @@ def get_snowflake_forecast_comparison():
         OVERALL_WORKLOAD
     FROM FORECAST_COMPARISON
     ORDER BY FORECAST_DATE
-    """
-    return execute_snowflake_query(query)
-
-
-@st.cache_data(ttl=300)
-def get_snowflake_all_issues_metrics():
-    """
-    Get key all issues forecast metrics for dashboard cards
-    """
-    query = """
-    SELECT 
-        'TOTAL_REQUESTS_NEXT_7_DAYS' AS metric,
-        SUM(PREDICTED_REQUESTS)::VARCHAR AS value,
-        'Expected total maintenance requests in next 7 days' AS description
-    FROM MAINTENANCE_SCHEDULE
-    WHERE FORECAST_DATE <= DATEADD('day', 7, CURRENT_DATE())
-    
-    UNION ALL
-    
-    SELECT 'TOTAL_REQUESTS_NEXT_30_DAYS', SUM(PREDICTED_REQUESTS)::VARCHAR, 'Expected total maintenance requests in next 30 days'
-    FROM MAINTENANCE_SCHEDULE
-    
-    UNION ALL
-    
-    SELECT 'HIGH_WORKLOAD_DAYS', COUNT(*)::VARCHAR, 'Days with high workload (next 30 days)'
-    FROM MAINTENANCE_SCHEDULE WHERE WORKLOAD_LEVEL = 'HIGH'
-    
-    UNION ALL
-    
-    SELECT 'TOTAL_PARTS_NEEDED', 
-           (SUM(BULBS_TO_STOCK) + SUM(WIRING_KITS_TO_STOCK) + SUM(POLES_TO_STOCK))::VARCHAR, 
-           'Total parts to stock for next 30 days'
-    FROM MAINTENANCE_SCHEDULE
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_issue_type_distribution():
-    """
-    Get historical issue type distribution from Snowflake
-    """
-    query = """
+SF_ISSUE_TYPE_DISTRIBUTION_QUERY = """
     SELECT 
         ISSUE_TYPE,
         TOTAL_COUNT,
@@ -742,16 +1129,10 @@ def get_snowflake_issue_type_distribution():
         UNIQUE_LIGHTS
     FROM ML_ISSUE_TYPE_DISTRIBUTION
     ORDER BY TOTAL_COUNT DESC
-    """
-    return execute_snowflake_query(query)
+"""
 
 
-@st.cache_data(ttl=300)
-def get_snowflake_all_issues_monthly_budget():
-    """
-    Get monthly budget forecast for all issues from Snowflake
-    """
-    query = """
+SF_ALL_ISSUES_MONTHLY_BUDGET_QUERY = """
     WITH forecast_costs AS (
         SELECT 
             DATE_TRUNC('month', FORECAST_DATE)::DATE AS MONTH,
@@ -782,5 +1163,214 @@ def get_snowflake_all_issues_monthly_budget():
         (PREDICTED_REQUESTS * 150) AS TOTAL_MONTHLY_BUDGET_INR
     FROM forecast_costs
     ORDER BY MONTH
+"""
+
+
+# Snowflake's date, the reference for the 7-day forecast metric cards
+SF_CURRENT_DATE_QUERY = """
+    SELECT CURRENT_DATE() AS TODAY
+"""
+
+
+# Tables shown on the Predictive Maintenance page, per forecast type
+SF_FORECAST_BUNDLES = {
+    "bulb": {
+        "forecast_30d": SF_FORECAST_30D_QUERY,
+        "weekly": SF_WEEKLY_FORECAST_QUERY,
+        "monthly_budget": SF_MONTHLY_BUDGET_QUERY,
+        "seasonal": SF_SEASONAL_FORECAST_QUERY,
+    },
+    "all_issues": {
+        "forecast_30d": SF_ALL_ISSUES_FORECAST_30D_QUERY,
+        "weekly": SF_WEEKLY_ALL_ISSUES_FORECAST_QUERY,
+        "monthly_budget": SF_ALL_ISSUES_MONTHLY_BUDGET_QUERY,
+        "comparison": SF_FORECAST_COMPARISON_QUERY,
+        "issue_distribution": SF_ISSUE_TYPE_DISTRIBUTION_QUERY,
+        "seasonal": SF_SEASONAL_FORECAST_QUERY,
+    },
+}
+
+
+# Forecast output table per forecast type (empty until the model is trained)
+SF_FORECAST_TABLES = {
+    "bulb": "BULB_REPLACEMENT_SCHEDULE",
+    "all_issues": "MAINTENANCE_SCHEDULE",
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def is_forecast_trained(forecast_type="bulb"):
+    """
+    Check if the forecast model for a forecast type has produced predictions
+    Probes a single row instead of fetching the forecast tables
+    """
+    query = f"SELECT 1 AS TRAINED FROM {SF_FORECAST_TABLES[forecast_type]} LIMIT 1"
+    return not execute_snowflake_query(query).empty
+
+
+def _empty_forecast_bundle(error, forecast_type="bulb"):
+    """
+    Report a failed forecast bundle fetch and return empty tables in its place
+    """
+    st.error(f"Snowflake query failed: {error}")
+    bundle = {name: pd.DataFrame() for name in SF_FORECAST_BUNDLES[forecast_type]}
+    bundle["metrics"] = pd.Series(dtype=object)
+    return bundle
+
+
+@swr_cache(fresh=300, stale=600, on_error=_empty_forecast_bundle)
+def get_snowflake_forecast_bundle(forecast_type="bulb"):
+    """
+    Get every forecast table for a forecast type ("bulb" or "all_issues")
+    with one multi-statement Snowflake query, as a dict of DataFrames
+    ("metrics" is a METRIC -> VALUE Series)
+    The tables are shared by all sessions and must not be modified in place
+    """
+    queries = SF_FORECAST_BUNDLES[forecast_type]
+    *frames, today = _run_snowflake_queries(list(queries.values()) + [SF_CURRENT_DATE_QUERY])
+    bundle = dict(zip(queries, frames))
+    bundle["forecast_30d"] = _compact(
+        bundle["forecast_30d"],
+        categories=("SEASON", "DAY_OF_WEEK", "PRIORITY", "WORKLOAD_LEVEL"),
+    )
+    # Metric cards are aggregates of the 30-day forecast, so no extra query;
+    # the 7-day window uses Snowflake's date, not the dashboard host's
+    bundle["metrics"] = _forecast_metrics(
+        bundle["forecast_30d"], forecast_type, today["TODAY"].iloc[0]
+    )
+    return bundle
+
+
+def get_snowflake_forecast_30d():
+    """
+    Get 30-day bulb failure forecast from Snowflake ML model
+    Served from the cached bulb forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("bulb")["forecast_30d"].copy()
+
+
+@st.cache_data(ttl=300)
+def get_snowflake_forecast_90d():
+    """
+    Get 90-day bulb failure forecast from Snowflake ML model
+    """
+    query = """
+    SELECT 
+        FORECAST_DATE,
+        PREDICTED_FAILURES,
+        LOWER_BOUND,
+        UPPER_BOUND,
+        WEEK_START,
+        MONTH_START,
+        SEASON
+    FROM BULB_FAILURE_FORECAST_90D
+    ORDER BY FORECAST_DATE
     """
     return execute_snowflake_query(query)
+
+
+def get_snowflake_weekly_forecast():
+    """
+    Get weekly forecast summary from Snowflake
+    Served from the cached bulb forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("bulb")["weekly"].copy()
+
+
+def get_snowflake_forecast_metrics():
+    """
+    Get key forecast metrics for dashboard cards from Snowflake
+    Returns a METRIC -> VALUE Series
+    Served from the cached bulb forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("bulb")["metrics"].copy()
+
+
+def get_snowflake_seasonal_forecast():
+    """
+    Get seasonal risk comparison from Snowflake
+    Served from the cached bulb forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("bulb")["seasonal"].copy()
+
+
+def get_snowflake_monthly_budget():
+    """
+    Get monthly budget forecast from Snowflake
+    Served from the cached bulb forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("bulb")["monthly_budget"].copy()
+
+
+# =============================================================================
+# ALL ISSUES FORECAST QUERIES (Total Maintenance Workload)
+# =============================================================================
+
+
+def get_snowflake_all_issues_forecast_30d():
+    """
+    Get 30-day all issues (total maintenance) forecast from Snowflake ML model
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["forecast_30d"].copy()
+
+
+@st.cache_data(ttl=300)
+def get_snowflake_all_issues_forecast_90d():
+    """
+    Get 90-day all issues forecast from Snowflake ML model
+    """
+    query = """
+    SELECT 
+        FORECAST_DATE,
+        PREDICTED_REQUESTS,
+        LOWER_BOUND,
+        UPPER_BOUND,
+        WEEK_START,
+        MONTH_START,
+        SEASON
+    FROM ALL_ISSUES_FORECAST_90D
+    ORDER BY FORECAST_DATE
+    """
+    return execute_snowflake_query(query)
+
+
+def get_snowflake_weekly_all_issues_forecast():
+    """
+    Get weekly all issues forecast summary from Snowflake
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["weekly"].copy()
+
+
+def get_snowflake_forecast_comparison():
+    """
+    Get comparison between bulb failures and all issues forecast
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["comparison"].copy()
+
+
+def get_snowflake_all_issues_metrics():
+    """
+    Get key all issues forecast metrics for dashboard cards
+    Returns a METRIC -> VALUE Series
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["metrics"].copy()
+
+
+def get_snowflake_issue_type_distribution():
+    """
+    Get historical issue type distribution from Snowflake
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["issue_distribution"].copy()
+
+
+def get_snowflake_all_issues_monthly_budget():
+    """
+    Get monthly budget forecast for all issues from Snowflake
+    Served from the cached all_issues forecast bundle (no query of its own)
+    """
+    return get_snowflake_forecast_bundle("all_issues")["monthly_budget"].copy()
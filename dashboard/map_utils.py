@@ -15,195 +15,416 @@
 """
 Map utility functions for Streamlit Dashboard
 Creates Folium maps with various layers
+Folium and pydeck are imported inside the functions that use them
 """
 
-import folium
-from folium import plugins
 import json
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
 from config import MAP_CONFIG, STATUS_COLORS, URGENCY_COLORS
 
+# Use orjson for GeoJSON parsing if available (same dicts/lists as json.loads)
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
-def create_base_map(center=None, zoom=None):
+
+def create_base_map(center=None, zoom=None, prefer_canvas=None):
     """
     Create base Folium map
+    prefer_canvas=False keeps vector layers on SVG (needed for text along lines)
     """
+    import folium
+    
     center = center or MAP_CONFIG["center"]
     zoom = zoom or MAP_CONFIG["zoom"]
+    if prefer_canvas is None:
+        prefer_canvas = MAP_CONFIG["prefer_canvas"]
     
     m = folium.Map(
         location=center,
         zoom_start=zoom,
-        tiles=MAP_CONFIG["tiles"]
+        tiles=MAP_CONFIG["tiles"],
+        prefer_canvas=prefer_canvas
     )
     
     return m
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def neighborhoods_feature_collection(neighborhoods_df):
+    """
+    Parse neighborhood boundaries into a single GeoJSON FeatureCollection
+    Cached per neighborhoods DataFrame so boundaries are parsed once, not per rerun
+    """
+    features = []
+    for name, population, boundary in zip(
+        neighborhoods_df['name'],
+        neighborhoods_df['population'],
+        neighborhoods_df['boundary_geojson']
+    ):
+        try:
+            features.append({
+                'type': 'Feature',
+                'geometry': _json.loads(boundary),
+                'properties': {
+                    'tooltip': f"<b>{name}</b><br>Population: {population:,}"
+                }
+            })
+        except Exception:
+            # Skip invalid geometries
+            continue
+    
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def neighborhood_centroids(neighborhoods_df):
+    """
+    Map each neighborhood name to the (lat, lon) centroid of its boundary
+    Parsed and reduced in one vectorized shapely (GEOS) pass; cached per DataFrame
+    """
+    import shapely
+    
+    # Invalid or missing boundaries become None and yield NaN coordinates
+    geoms = shapely.from_geojson(
+        neighborhoods_df['boundary_geojson'].to_numpy(dtype=object), on_invalid='ignore'
+    )
+    points = shapely.centroid(geoms)
+    lats = shapely.get_y(points)
+    lons = shapely.get_x(points)
+    
+    centroids = {}
+    for name, lat, lon in zip(neighborhoods_df['name'], lats, lons):
+        # First boundary wins if a name repeats
+        if not np.isnan(lat):
+            centroids.setdefault(name, (float(lat), float(lon)))
+    
+    return centroids
+
+
+# Every neighborhood polygon shares one style
+NEIGHBORHOOD_STYLE = {
+    'fillColor': '#3498db',
+    'color': '#2c3e50',
+    'weight': 2,
+    'fillOpacity': 0.1
+}
+
+
+def _neighborhood_style(_feature):
+    """
+    Folium style_function returning the shared neighborhood style
+    """
+    return NEIGHBORHOOD_STYLE
+
+
 def add_neighborhoods_layer(map_obj, neighborhoods_df):
     """
-    Add neighborhood polygons to map
+    Add neighborhood polygons to map (one GeoJson layer for all neighborhoods)
     """
+    import folium
+    
     if neighborhoods_df.empty:
         return map_obj
     
-    for _, row in neighborhoods_df.iterrows():
-        try:
-            geojson = json.loads(row['boundary_geojson'])
-            
-            folium.GeoJson(
-                geojson,
-                name=row['name'],
-                style_function=lambda x: {
-                    'fillColor': '#3498db',
-                    'color': '#2c3e50',
-                    'weight': 2,
-                    'fillOpacity': 0.1
-                },
-                tooltip=folium.Tooltip(
-                    f"<b>{row['name']}</b><br>"
-                    f"Population: {row['population']:,}",
-                    sticky=True
-                )
-            ).add_to(map_obj)
-        except Exception as e:
-            # Skip invalid geometries
-            continue
+    folium.GeoJson(
+        neighborhoods_feature_collection(neighborhoods_df),
+        name="Neighborhoods",
+        style_function=_neighborhood_style,
+        tooltip=folium.GeoJsonTooltip(fields=['tooltip'], labels=False, sticky=True)
+    ).add_to(map_obj)
     
     return map_obj
 
 
-def add_lights_layer(map_obj, lights_df, show_status_legend=True):
+# Columns read by the per-marker lights layer, in unpacking order
+LIGHT_POPUP_COLUMNS = [
+    'light_id', 'status', 'latitude', 'longitude', 'neighborhood_name',
+    'wattage', 'age_months', 'failure_risk_score', 'predicted_failure_date'
+]
+
+# Values used when an optional popup column is absent from the frame
+LIGHT_POPUP_DEFAULTS = {
+    'neighborhood_name': 'N/A',
+    'wattage': 'N/A',
+    'age_months': 0,
+    'failure_risk_score': None,
+    'predicted_failure_date': None,
+}
+
+
+def _popup_text(series):
+    """
+    Render a popup column as strings (missing values show as N/A)
+    """
+    return series.astype(object).where(series.notna(), 'N/A').astype(str)
+
+
+def _popup_optional(series):
+    """
+    Render a popup column as strings, keeping missing values as None (null in JS)
+    """
+    return series.astype(str).astype(object).where(series.notna(), None)
+
+
+# Leaflet callback for FastMarkerCluster rows of
+# [lat, lon, color, light_id, status, neighborhood, wattage, age, risk, predicted]
+# Popup HTML is only assembled when a popup is opened
+FAST_LIGHT_CALLBACK = """
+function (row) {
+    // Escape database text before it is concatenated into tooltip/popup HTML
+    function esc(value) {
+        return String(value).replace(/[&<>"']/g, function (c) {
+            return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+        });
+    }
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 6, color: row[2], fill: true, fillColor: row[2],
+        fillOpacity: 0.7, weight: 2
+    });
+    marker.bindTooltip(esc(row[3]) + " - " + esc(row[4]));
+    marker.bindPopup(function () {
+        var html = '<div style="font-family: Arial; width: 200px;">'
+            + '<h4 style="margin: 0;">' + esc(row[3]) + '</h4>'
+            + '<hr style="margin: 5px 0;">'
+            + '<b>Status:</b> ' + esc(row[4]) + '<br>'
+            + '<b>Neighborhood:</b> ' + esc(row[5]) + '<br>'
+            + '<b>Wattage:</b> ' + esc(row[6]) + 'W<br>'
+            + '<b>Age:</b> ' + esc(row[7]) + ' months<br>';
+        if (row[8] !== null) {
+            html += '<b>Risk Score:</b> ' + row[8].toFixed(2) + '<br>';
+        }
+        if (row[9] !== null) {
+            html += '<b>Predicted Failure:</b> ' + esc(row[9]) + '<br>';
+        }
+        return html + '</div>';
+    }, {maxWidth: 250});
+    return marker;
+}
+"""
+
+
+def add_lights_layer(map_obj, lights_df, show_status_legend=True, max_precision=5):
     """
     Add street lights markers to map (color-coded by status)
+    Markers are built in the browser with FastMarkerCluster; popups render on open
     """
+    from folium import plugins
+    
     if lights_df.empty:
         return map_obj
     
-    # Create marker cluster
-    marker_cluster = plugins.MarkerCluster(
+    # Plain columns instead of a Series per row; optional columns get defaults
+    rows = lights_df.reindex(columns=LIGHT_POPUP_COLUMNS)
+    for col, default in LIGHT_POPUP_DEFAULTS.items():
+        if col not in lights_df.columns:
+            rows[col] = default
+    
+    # One compact data array for the browser instead of a marker + popup per light
+    risk = pd.to_numeric(rows['failure_risk_score'], errors='coerce').round(4)
+    data = pd.DataFrame({
+        'latitude': rows['latitude'].astype(float).round(max_precision),
+        'longitude': rows['longitude'].astype(float).round(max_precision),
+        'color': rows['status'].map(STATUS_COLORS).astype(object).fillna('#95a5a6'),
+        'light_id': rows['light_id'].astype(str),
+        'status': rows['status'].astype(str),
+        'neighborhood_name': _popup_text(rows['neighborhood_name']),
+        'wattage': _popup_text(rows['wattage']),
+        'age_months': _popup_text(rows['age_months']),
+        'failure_risk_score': risk.astype(object).where(risk.notna(), None),
+        'predicted_failure_date': _popup_optional(rows['predicted_failure_date']),
+    })
+    
+    plugins.FastMarkerCluster(
+        data=data.values.tolist(),
+        callback=FAST_LIGHT_CALLBACK,
         name="Street Lights",
         options={
             'maxClusterRadius': 50,
             'disableClusteringAtZoom': 15
         }
-    )
-    
-    for _, light in lights_df.iterrows():
-        # Determine color based on status
-        color = STATUS_COLORS.get(light['status'], '#95a5a6')
-        
-        # Create popup content
-        popup_html = f"""
-        <div style="font-family: Arial; width: 200px;">
-            <h4 style="margin: 0;">{light['light_id']}</h4>
-            <hr style="margin: 5px 0;">
-            <b>Status:</b> {light['status']}<br>
-            <b>Neighborhood:</b> {light.get('neighborhood_name', 'N/A')}<br>
-            <b>Wattage:</b> {light.get('wattage', 'N/A')}W<br>
-            <b>Age:</b> {light.get('age_months', 0)} months<br>
-        """
-        
-        if light.get('failure_risk_score'):
-            popup_html += f"<b>Risk Score:</b> {light['failure_risk_score']:.2f}<br>"
-        
-        if light.get('predicted_failure_date'):
-            popup_html += f"<b>Predicted Failure:</b> {light['predicted_failure_date']}<br>"
-        
-        popup_html += "</div>"
-        
-        # Create marker
-        folium.CircleMarker(
-            location=[light['latitude'], light['longitude']],
-            radius=6,
-            popup=folium.Popup(popup_html, max_width=250),
-            tooltip=f"{light['light_id']} - {light['status']}",
-            color=color,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.7,
-            weight=2
-        ).add_to(marker_cluster)
-    
-    marker_cluster.add_to(map_obj)
+    ).add_to(map_obj)
     
     return map_obj
 
 
+# Every supplier service area shares one style
+SERVICE_AREA_STYLE = {
+    'color': 'blue',
+    'fill': True,
+    'fillOpacity': 0.05,
+    'weight': 1,
+    'dashArray': '5, 5'
+}
+
+# Mean Earth radius in meters (same value Leaflet uses for circles)
+EARTH_RADIUS_M = 6371000
+
+
+def _service_area_style(_feature):
+    """
+    Folium style_function returning the shared service area style
+    """
+    return SERVICE_AREA_STYLE
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def service_area_feature_collection(suppliers_df, segments=64):
+    """
+    Build every supplier's service radius as a GeoJSON polygon
+    Ring vertices for all suppliers are computed at once on the sphere with NumPy
+    """
+    lat = np.radians(suppliers_df['latitude'].to_numpy(dtype=float))[:, None]
+    lon = np.radians(suppliers_df['longitude'].to_numpy(dtype=float))[:, None]
+    # Angular distance of each radius (km -> m -> radians)
+    delta = (suppliers_df['service_radius_km'].to_numpy(dtype=float) * 1000 / EARTH_RADIUS_M)[:, None]
+    bearing = np.linspace(0, 2 * np.pi, segments + 1)[None, :]
+    
+    ring_lat = np.arcsin(
+        np.sin(lat) * np.cos(delta) + np.cos(lat) * np.sin(delta) * np.cos(bearing)
+    )
+    ring_lon = lon + np.arctan2(
+        np.sin(bearing) * np.sin(delta) * np.cos(lat),
+        np.cos(delta) - np.sin(lat) * np.sin(ring_lat)
+    )
+    # GeoJSON uses [lon, lat] order
+    rings = np.stack([np.degrees(ring_lon), np.degrees(ring_lat)], axis=-1).round(6)
+    
+    features = [
+        {
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': [ring.tolist()]},
+            'properties': {'name': name}
+        }
+        for name, ring in zip(suppliers_df['name'], rings)
+    ]
+    return {'type': 'FeatureCollection', 'features': features}
+
+
 def add_suppliers_layer(map_obj, suppliers_df):
     """
     Add supplier markers with service radius circles
+    All service areas are drawn as one GeoJson layer
     """
+    import folium
+    
     if suppliers_df.empty:
         return map_obj
     
-    for _, supplier in suppliers_df.iterrows():
+    folium.GeoJson(
+        service_area_feature_collection(suppliers_df),
+        name="Supplier Service Areas",
+        style_function=_service_area_style
+    ).add_to(map_obj)
+    
+    rows = suppliers_df[[
+        'name', 'latitude', 'longitude', 'specialization',
+        'service_radius_km', 'avg_response_hours', 'contact_phone'
+    ]].itertuples(index=False, name=None)
+    
+    for (name, latitude, longitude, specialization,
+         service_radius_km, avg_response_hours, contact_phone) in rows:
         # Supplier marker
         folium.Marker(
-            location=[supplier['latitude'], supplier['longitude']],
+            location=[latitude, longitude],
             popup=f"""
             <div style="font-family: Arial; width: 200px;">
-                <h4 style="margin: 0;">{supplier['name']}</h4>
+                <h4 style="margin: 0;">{name}</h4>
                 <hr style="margin: 5px 0;">
-                <b>Specialization:</b> {supplier['specialization']}<br>
-                <b>Service Radius:</b> {supplier['service_radius_km']} km<br>
-                <b>Avg Response:</b> {supplier['avg_response_hours']} hours<br>
-                <b>Contact:</b> {supplier['contact_phone']}<br>
+                <b>Specialization:</b> {specialization}<br>
+                <b>Service Radius:</b> {service_radius_km} km<br>
+                <b>Avg Response:</b> {avg_response_hours} hours<br>
+                <b>Contact:</b> {contact_phone}<br>
             </div>
             """,
-            tooltip=supplier['name'],
+            tooltip=name,
             icon=folium.Icon(color='blue', icon='wrench', prefix='fa')
         ).add_to(map_obj)
-        
-        # Service radius circle
-        folium.Circle(
-            location=[supplier['latitude'], supplier['longitude']],
-            radius=supplier['service_radius_km'] * 1000,  # Convert km to meters
-            color='blue',
-            fill=True,
-            fillOpacity=0.05,
-            weight=1,
-            dash_array='5, 5'
-        ).add_to(map_obj)
     
     return map_obj
 
 
-def add_predicted_failures_layer(map_obj, predictions_df):
+# Leaflet callback for FastMarkerCluster rows of
+# [lat, lon, color, light_id, urgency, status, neighborhood, predicted, risk, season]
+FAST_PREDICTION_CALLBACK = """
+function (row) {
+    // Escape database text before it is concatenated into tooltip/popup HTML
+    function esc(value) {
+        return String(value).replace(/[&<>"']/g, function (c) {
+            return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+        });
+    }
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 8, color: row[2], fill: true, fillColor: row[2],
+        fillOpacity: 0.8, weight: 3
+    });
+    marker.bindTooltip(esc(row[3]) + " - " + esc(row[4]));
+    marker.bindPopup(function () {
+        var risk = row[8] === null ? 'N/A' : row[8].toFixed(2);
+        return '<div style="font-family: Arial; width: 220px;">'
+            + '<h4 style="margin: 0; color: ' + row[2] + ';">' + esc(row[3]) + '</h4>'
+            + '<hr style="margin: 5px 0;">'
+            + '<b>Current Status:</b> ' + esc(row[5]) + '<br>'
+            + '<b>Neighborhood:</b> ' + esc(row[6]) + '<br>'
+            + '<b>Predicted Failure:</b> ' + esc(row[7]) + '<br>'
+            + '<b>Risk Score:</b> ' + risk + '<br>'
+            + '<b>Urgency:</b> <span style="color: ' + row[2] + '; font-weight: bold;">'
+            + esc(row[4]) + '</span><br>'
+            + '<b>Season:</b> ' + esc(row[9]) + '<br>'
+            + '</div>';
+    }, {maxWidth: 250});
+    return marker;
+}
+"""
+
+
+def add_predicted_failures_layer(map_obj, predictions_df, max_precision=5):
     """
     Add markers for lights predicted to fail soon
-    Color-coded by urgency
+    Color-coded by urgency; clustered in the browser so dense areas stay readable
     """
+    from folium import plugins
+    
     if predictions_df.empty:
         return map_obj
     
-    for _, light in predictions_df.iterrows():
-        urgency = light.get('maintenance_urgency', 'LOW')
-        color = URGENCY_COLORS.get(urgency, '#95a5a6')
-        
-        popup_html = f"""
-        <div style="font-family: Arial; width: 220px;">
-            <h4 style="margin: 0; color: {color};">{light['light_id']}</h4>
-            <hr style="margin: 5px 0;">
-            <b>Current Status:</b> {light['status']}<br>
-            <b>Neighborhood:</b> {light['neighborhood_name']}<br>
-            <b>Predicted Failure:</b> {light['predicted_failure_date']}<br>
-            <b>Risk Score:</b> {light['failure_risk_score']:.2f}<br>
-            <b>Urgency:</b> <span style="color: {color}; font-weight: bold;">{urgency}</span><br>
-            <b>Season:</b> {light['season']}<br>
-        </div>
-        """
-        
-        folium.CircleMarker(
-            location=[light['latitude'], light['longitude']],
-            radius=8,
-            popup=folium.Popup(popup_html, max_width=250),
-            tooltip=f"{light['light_id']} - {urgency}",
-            color=color,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.8,
-            weight=3
-        ).add_to(map_obj)
+    rows = predictions_df.reindex(columns=[
+        'light_id', 'status', 'neighborhood_name', 'predicted_failure_date',
+        'failure_risk_score', 'season', 'latitude', 'longitude', 'maintenance_urgency'
+    ])
+    if 'maintenance_urgency' not in predictions_df.columns:
+        rows['maintenance_urgency'] = 'LOW'
+    
+    # Popup values travel as compact row data, not as prebuilt HTML per marker
+    risk = pd.to_numeric(rows['failure_risk_score'], errors='coerce').round(4)
+    data = pd.DataFrame({
+        'latitude': rows['latitude'].astype(float).round(max_precision),
+        'longitude': rows['longitude'].astype(float).round(max_precision),
+        'color': rows['maintenance_urgency'].map(URGENCY_COLORS).astype(object).fillna('#95a5a6'),
+        'light_id': rows['light_id'].astype(str),
+        'maintenance_urgency': rows['maintenance_urgency'].astype(str),
+        'status': rows['status'].astype(str),
+        'neighborhood_name': _popup_text(rows['neighborhood_name']),
+        'predicted_failure_date': _popup_text(rows['predicted_failure_date']),
+        'failure_risk_score': risk.astype(object).where(risk.notna(), None),
+        'season': _popup_text(rows['season']),
+    })
+    
+    # Leaflet.markercluster's grid index culls offscreen markers on pan/zoom
+    plugins.FastMarkerCluster(
+        data=data.values.tolist(),
+        callback=FAST_PREDICTION_CALLBACK,
+        name="Predicted Failures",
+        options={
+            'maxClusterRadius': 30,
+            'disableClusteringAtZoom': 15
+        }
+    ).add_to(map_obj)
     
     return map_obj
 
@@ -214,6 +435,14 @@ def create_legend_html(items):
     items: list of (label, color) tuples or (label, color, marker_type) tuples
     marker_type can be 'circle' (default), 'marker', or 'line'
     """
+    return _legend_html(tuple(tuple(item) for item in items))
+
+
+@lru_cache(maxsize=32)
+def _legend_html(items):
+    """
+    Build the legend HTML, memoized on the items tuple
+    """
     legend_html = '''
     <div style="position: fixed; 
                 bottom: 50px; right: 50px; width: 240px; 
@@ -275,82 +504,70 @@ def create_legend_html(items):
     return legend_html
 
 
+def add_legend(map_obj, items):
+    """
+    Add a create_legend_html legend to a Folium map
+    """
+    import folium
+    
+    map_obj.get_root().html.add_child(folium.Element(create_legend_html(items)))
+    return map_obj
+
+
 def add_neighborhood_supplier_lines(map_obj, neighborhood_supplier_df, neighborhoods_df, suppliers_df):
     """
     Add lines connecting neighborhoods to their nearest suppliers with distance labels
+    Labels are SVG text along each line, so the map must not prefer canvas
     """
+    import folium
+    from folium import plugins
+    
     if neighborhood_supplier_df.empty or neighborhoods_df.empty or suppliers_df.empty:
         return map_obj
     
     # Create a feature group for connection lines so they're on top
     connections_group = folium.FeatureGroup(name='Supplier Connections')
     
-    for _, row in neighborhood_supplier_df.iterrows():
-        # Find neighborhood center
-        neighborhood = neighborhoods_df[neighborhoods_df['name'] == row['neighborhood']]
-        if neighborhood.empty:
-            continue
-        
-        try:
-            geojson = json.loads(neighborhood.iloc[0]['boundary_geojson'])
-            # Get centroid from the GeoJSON
-            if geojson['type'] == 'Polygon':
-                coords = geojson['coordinates'][0]
-            elif geojson['type'] == 'MultiPolygon':
-                coords = geojson['coordinates'][0][0]
-            else:
-                continue
-            
-            # Calculate centroid (simple average of coordinates)
-            # GeoJSON uses [lon, lat] order
-            lats = [coord[1] for coord in coords]
-            lons = [coord[0] for coord in coords]
-            nh_lat = sum(lats) / len(lats)
-            nh_lon = sum(lons) / len(lons)
-        except Exception as e:
-            print(f"Error processing neighborhood {row.get('neighborhood', 'unknown')}: {e}")
-            continue
-        
-        # Find supplier location
-        supplier = suppliers_df[suppliers_df['name'] == row['nearest_supplier']]
-        if supplier.empty:
+    # Lookups built once instead of filtering the frames for every row
+    centroids = neighborhood_centroids(neighborhoods_df)
+    supplier_locations = dict(zip(
+        suppliers_df['name'],
+        zip(suppliers_df['latitude'].astype(float), suppliers_df['longitude'].astype(float))
+    ))
+    
+    rows = neighborhood_supplier_df[['neighborhood', 'nearest_supplier', 'distance_km']]
+    for neighborhood, nearest_supplier, distance_km in rows.itertuples(index=False, name=None):
+        # Find neighborhood center and supplier location
+        if neighborhood not in centroids or nearest_supplier not in supplier_locations:
             continue
         
-        supplier_lat = supplier.iloc[0]['latitude']
-        supplier_lon = supplier.iloc[0]['longitude']
+        nh_lat, nh_lon = centroids[neighborhood]
+        supplier_lat, supplier_lon = supplier_locations[nearest_supplier]
         
         # Draw line with more visibility
-        folium.PolyLine(
+        line = folium.PolyLine(
             locations=[[nh_lat, nh_lon], [supplier_lat, supplier_lon]],
             color='#e74c3c',  # Red color for better visibility
             weight=3,
             opacity=0.8,
             dash_array='10, 5',
-            popup=f"{row['neighborhood']} → {row['nearest_supplier']}: {row['distance_km']:.2f} km"
+            popup=f"{neighborhood} → {nearest_supplier}: {distance_km:.2f} km"
         ).add_to(connections_group)
         
-        # Add distance label at midpoint
-        mid_lat = (nh_lat + supplier_lat) / 2
-        mid_lon = (nh_lon + supplier_lon) / 2
-        
-        folium.Marker(
-            location=[mid_lat, mid_lon],
-            icon=folium.DivIcon(html=f'''
-                <div style="
-                    background-color: white;
-                    border: 2px solid #e74c3c;
-                    border-radius: 5px;
-                    padding: 4px 8px;
-                    font-size: 12px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    white-space: nowrap;
-                    box-shadow: 0 2px 6px rgba(0,0,0,0.4);
-                ">
-                    {row['distance_km']:.1f} km
-                </div>
-            '''),
-            popup=f"{row['neighborhood']} ↔ {row['nearest_supplier']}"
+        # Distance label drawn on the line itself instead of a marker per connection
+        plugins.PolyLineTextPath(
+            line,
+            f" {distance_km:.1f} km ",
+            center=True,
+            offset=-6,
+            attributes={
+                'fill': '#e74c3c',
+                'font-weight': 'bold',
+                'font-size': '12',
+                'stroke': 'white',
+                'stroke-width': '3',
+                'paint-order': 'stroke'
+            }
         ).add_to(connections_group)
     
     # Add the feature group to the map
@@ -359,8 +576,96 @@ def add_neighborhood_supplier_lines(map_obj, neighborhood_supplier_df, neighborh
     return map_obj
 
 
+def render_map_html(map_obj):
+    """
+    Render a finished map to a standalone HTML page
+    Pages cache this string so an unchanged map is not rebuilt on rerun
+    """
+    return map_obj.get_root().render()
+
+
+def show_map_html(html, height=500):
+    """
+    Display a pre-rendered map (from render_map_html)
+    No map state is sent back to Python, like st_folium(returned_objects=[])
+    """
+    components.html(html, height=height)
+
+
+def _hex_to_rgb(hex_color):
+    """Convert '#rrggbb' to an [r, g, b] list for pydeck"""
+    return [int(hex_color[i:i + 2], 16) for i in (1, 3, 5)]
+
+
+def create_lights_deck(lights_df, neighborhoods_df=None, suppliers_df=None, max_precision=5):
+    """
+    Build a pydeck map with lights as a WebGL ScatterplotLayer
+    For light counts where per-marker Folium layers get slow; neighborhoods
+    and suppliers are added when given
+    """
+    import pydeck as pdk
+    
+    layers = []
+    
+    if neighborhoods_df is not None and not neighborhoods_df.empty:
+        layers.append(pdk.Layer(
+            "GeoJsonLayer",
+            data=neighborhoods_feature_collection(neighborhoods_df),
+            stroked=True,
+            filled=True,
+            get_fill_color=_hex_to_rgb('#3498db') + [25],
+            get_line_color=_hex_to_rgb('#2c3e50'),
+            line_width_min_pixels=2,
+            pickable=True,
+        ))
+    
+    colors = {status: _hex_to_rgb(color) for status, color in STATUS_COLORS.items()}
+    fallback = _hex_to_rgb('#95a5a6')
+    lights = lights_df[['longitude', 'latitude']].astype(float).round(max_precision)
+    lights['color'] = [colors.get(status, fallback) for status in lights_df['status']]
+    lights['tooltip'] = lights_df['light_id'].astype(str) + " - " + lights_df['status'].astype(str)
+    layers.append(pdk.Layer(
+        "ScatterplotLayer",
+        data=lights,
+        get_position='[longitude, latitude]',
+        get_fill_color='color',
+        get_radius=4,
+        radius_units='pixels',
+        pickable=True,
+    ))
+    
+    if suppliers_df is not None and not suppliers_df.empty:
+        suppliers = suppliers_df[['longitude', 'latitude']].astype(float)
+        suppliers['tooltip'] = suppliers_df['name'].astype(str)
+        layers.append(pdk.Layer(
+            "ScatterplotLayer",
+            data=suppliers,
+            get_position='[longitude, latitude]',
+            get_fill_color=_hex_to_rgb('#3498db'),
+            get_line_color=[255, 255, 255],
+            stroked=True,
+            line_width_min_pixels=2,
+            get_radius=9,
+            radius_units='pixels',
+            pickable=True,
+        ))
+    
+    return pdk.Deck(
+        layers=layers,
+        initial_view_state=pdk.ViewState(
+            latitude=MAP_CONFIG["center"][0],
+            longitude=MAP_CONFIG["center"][1],
+            zoom=MAP_CONFIG["zoom"],
+        ),
+        map_style=pdk.map_styles.CARTO_LIGHT,
+        tooltip={"html": "{tooltip}"},
+    )
+
+
 def add_fullscreen_control(map_obj):
     """Add fullscreen button to map"""
+    from folium import plugins
+    
     plugins.Fullscreen(
         position='topleft',
         title='Fullscreen',
@@ -0,0 +1,124 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Faulty Lights Analysis page
+Faulty lights with their nearest supplier
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from db_utils import (
+    get_status_counts, get_neighborhoods, get_faulty_lights_with_supplier
+)
+from map_utils import (
+    create_base_map, add_neighborhoods_layer, add_lights_layer,
+    add_fullscreen_control, render_map_html, show_map_html
+)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def faulty_lights_map_html(filtered_df, neighborhoods_df):
+    """
+    Build the faulty lights map and render it to HTML
+    Cached on the filtered lights and neighborhoods
+    """
+    m = create_base_map()
+    m = add_neighborhoods_layer(m, neighborhoods_df)
+    
+    if not filtered_df.empty:
+        # Convert to format expected by add_lights_layer
+        map_df = filtered_df.rename(columns={'neighborhood': 'neighborhood_name'})
+        m = add_lights_layer(m, map_df, show_status_legend=False)
+    
+    m = add_fullscreen_control(m)
+    return render_map_html(m)
+
+
+def render():
+    """Render the page"""
+    st.title("🔴 Faulty Lights Analysis")
+    st.markdown("Analysis of currently faulty lights with nearest suppliers")
+    
+    # Load data
+    with st.spinner("Loading faulty lights data..."):
+        faulty_df = get_faulty_lights_with_supplier()
+        status_counts = get_status_counts()
+        neighborhoods_df = get_neighborhoods()
+    
+    # Metrics
+    col1, col2, col3 = st.columns(3)
+    
+    total_faulty = len(faulty_df)
+    total_lights = int(status_counts['total'].iloc[0]) if not status_counts.empty else 0
+    faulty_pct = (total_faulty / total_lights * 100) if total_lights > 0 else 0
+    
+    col1.metric("Faulty Lights", f"{total_faulty:,}")
+    col2.metric("Percentage", f"{faulty_pct:.2f}%", delta_color="inverse")
+    col3.metric("Avg Distance to Supplier", 
+                f"{faulty_df['distance_km'].mean():.2f} km" if not faulty_df.empty else "N/A")
+    
+    st.markdown("---")
+    
+    # Filters, map, table and chart rerun as a fragment on widget changes
+    @st.fragment
+    def faulty_lights_details(faulty_df, neighborhoods_df):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            neighborhoods = faulty_df['neighborhood'].unique().tolist() if not faulty_df.empty else []
+            selected_nh = st.multiselect("Filter by Neighborhood", neighborhoods, default=[])
+        
+        with col2:
+            max_distance = st.slider("Max Distance to Supplier (km)", 0.0, 20.0, 20.0, 0.5)
+        
+        # Apply filters (pushed down to PostGIS as bind parameters)
+        filtered_df = get_faulty_lights_with_supplier(tuple(selected_nh), max_distance)
+        
+        # Map
+        st.markdown("### Faulty Lights Map")
+        show_map_html(faulty_lights_map_html(filtered_df, neighborhoods_df), height=500)
+        
+        # Table
+        st.markdown("### Faulty Lights with Nearest Supplier")
+        if not filtered_df.empty:
+            display_df = filtered_df[[
+                'light_id', 'neighborhood', 'nearest_supplier', 
+                'specialization', 'distance_km', 'avg_response_hours', 'contact_phone'
+            ]]
+            
+            st.dataframe(
+                display_df,
+                column_config={
+                    'distance_km': st.column_config.ProgressColumn(
+                        format='%.2f km', min_value=0,
+                        max_value=float(display_df['distance_km'].max()) or 1.0
+                    )
+                },
+                width='stretch'
+            )
+            
+            # Bar chart: Faulty lights per neighborhood
+            st.markdown("### Faulty Lights by Neighborhood")
+            nh_counts = filtered_df['neighborhood'].value_counts().reset_index(name='count')
+            
+            fig = px.bar(nh_counts, x='neighborhood', y='count',
+                         title="Faulty Lights Count by Neighborhood",
+                         labels={'count': 'Number of Faulty Lights', 'neighborhood': 'Neighborhood'})
+            st.plotly_chart(fig, width='stretch')
+        else:
+            st.info("No faulty lights match the selected filters")
+    
+    faulty_lights_details(faulty_df, neighborhoods_df)
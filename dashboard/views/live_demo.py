@@ -0,0 +1,179 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Live Demo Controls page
+Simulate failures and maintenance for demos
+"""
+
+import streamlit as st
+
+from db_utils import (
+    get_status_counts, simulate_light_failure, trigger_scheduled_maintenance,
+    get_snowflake_forecast_bundle, refresh_enriched_snapshot
+)
+
+
+def render():
+    """Render the page"""
+    st.title("🎮 Live Demo Controls")
+    st.markdown("Interactive controls for demonstrating real-time updates")
+    
+    st.warning("⚠️ These actions modify the database. Use for demo purposes only!")
+    
+    # Current stats
+    with st.spinner("Loading current status..."):
+        status_counts = get_status_counts()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    if not status_counts.empty:
+        counts = status_counts.iloc[0]
+        total = int(counts['total'])
+        operational = int(counts['operational'])
+        faulty = int(counts['faulty'])
+        maintenance = int(counts['maintenance_required'])
+        
+        col1.metric("Total Lights", f"{total:,}")
+        col2.metric("Operational", f"{operational:,}")
+        col3.metric("Faulty", f"{faulty:,}")
+        col4.metric("Maintenance Required", f"{maintenance:,}")
+    
+    st.markdown("---")
+    
+    # Demo controls rerun as a fragment (a successful write reruns the whole page)
+    @st.fragment
+    def live_controls():
+        # Control 1: Simulate random failure
+        st.markdown("### 🔴 Simulate Light Failure")
+        st.markdown("Randomly select an operational light and set it to faulty status")
+        
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            if st.button("Simulate Random Failure", type="primary", width='stretch'):
+                success, message = simulate_light_failure()
+                if success:
+                    st.success(message)
+                    st.rerun()
+                else:
+                    st.error(message)
+        
+        with col2:
+            st.info("This will update one random operational light to faulty status and refresh the dashboard")
+        
+        st.markdown("---")
+        
+        # Control 2: Trigger scheduled maintenance
+        st.markdown("### 🟡 Trigger Scheduled Maintenance")
+        st.markdown("Set multiple operational lights to require maintenance")
+        
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            count = st.number_input("Number of lights", min_value=1, max_value=20, value=5)
+            
+            if st.button("Trigger Maintenance", type="secondary", width='stretch'):
+                success, message = trigger_scheduled_maintenance(count)
+                if success:
+                    st.success(message)
+                    st.rerun()
+                else:
+                    st.error(message)
+        
+        with col2:
+            st.info(f"This will set {count} random operational lights to maintenance_required status")
+    
+    live_controls()
+    
+    st.markdown("---")
+    
+    # Control 3: Refresh data
+    st.markdown("### 🔄 Refresh Dashboard")
+    st.markdown("Clear cache and reload all data from database")
+    
+    if st.button("Refresh All Data", width='content'):
+        # Re-snapshot season, age and urgency in the enriched lights
+        refresh_enriched_snapshot(force=True)
+        st.cache_data.clear()
+        get_snowflake_forecast_bundle.clear()
+        st.success("Cache cleared! Dashboard will refresh.")
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # Control 4: Auto-refresh toggle
+    st.markdown("### ⏱️ Auto-Refresh")
+    
+    auto_refresh = st.checkbox("Enable auto-refresh (every 30 seconds)")
+    
+    if auto_refresh:
+        import time
+        st.info("Auto-refresh enabled. Page will reload every 30 seconds.")
+        time.sleep(30)
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # Demo script hints
+    st.markdown("### 📝 Demo Script Hints")
+    
+    with st.expander("🎤 Presenter Notes"):
+        st.markdown("""
+        **Demo Flow Suggestions:**
+        
+        1. **Start with Neighborhood Overview** 
+           - Show the complete map with all layers
+           - Explain the color coding and spatial distribution
+           
+        2. **Navigate to Faulty Lights Analysis**
+           - Show current faulty lights with nearest suppliers
+           - Demonstrate filtering by neighborhood
+           
+        3. **Show Predictive Maintenance**
+           - Explain the prediction algorithm
+           - Show timeline of upcoming failures
+           - Discuss seasonal patterns
+           
+        4. **Demonstrate Live Updates** (this page)
+           - Click "Simulate Random Failure"
+           - Go back to Faulty Lights page - show new red marker
+           - Go to Neighborhood Overview - show updated metrics
+           
+        5. **Supplier Coverage**
+           - Show supplier locations and service areas
+           - Discuss coverage gaps
+           
+        **Key Talking Points:**
+        - Real-time PostGIS queries (no caching delays)
+        - Enrichment data improves predictions
+        - Spatial operations (ST_Within, ST_Distance)
+        - Production-ready architecture
+        """)
+    
+    with st.expander("🔍 Quick Validation"):
+        st.markdown("""
+        **Verify Demo is Working:**
+        
+        - ✅ All metrics show non-zero values
+        - ✅ Maps load with markers visible
+        - ✅ Tables display data
+        - ✅ Simulate failure updates the database
+        - ✅ Refresh shows updated counts
+        
+        **Troubleshooting:**
+        - If no data shows: Check if `data/load_data.sql` was run
+        - If maps are empty: Verify PostgreSQL container is running
+        - If refresh fails: Check database connection in config.py
+        """)
@@ -0,0 +1,167 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Neighborhood Overview page
+Interactive map of neighborhoods, street lights, and suppliers
+"""
+
+import streamlit as st
+
+from config import STATUS_COLORS, DECK_LIGHTS_THRESHOLD
+from db_utils import (
+    get_lights_map, get_neighborhoods, get_suppliers, get_neighborhood_stats,
+    get_status_counts
+)
+from map_utils import (
+    create_base_map, add_neighborhoods_layer, add_lights_layer,
+    add_suppliers_layer, add_legend, add_fullscreen_control,
+    render_map_html, show_map_html, create_lights_deck
+)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def overview_map_html(lights_df, neighborhoods_df, suppliers_df, show_layers):
+    """
+    Build the overview map and render it to HTML
+    Cached on the input frames and layer selection
+    """
+    m = create_base_map()
+    
+    if "Neighborhoods" in show_layers and not neighborhoods_df.empty:
+        m = add_neighborhoods_layer(m, neighborhoods_df)
+    
+    if "Lights" in show_layers and not lights_df.empty:
+        m = add_lights_layer(m, lights_df)
+    
+    if "Suppliers" in show_layers and not suppliers_df.empty:
+        m = add_suppliers_layer(m, suppliers_df)
+    
+    m = add_fullscreen_control(m)
+    
+    # Add legend
+    legend_items = []
+    if "Lights" in show_layers:
+        legend_items.extend([
+            ("Operational", STATUS_COLORS['operational'], 'circle'),
+            ("Maintenance Required", STATUS_COLORS['maintenance_required'], 'circle'),
+            ("Faulty", STATUS_COLORS['faulty'], 'circle')
+        ])
+    if "Suppliers" in show_layers:
+        legend_items.append(("Supplier", "#3498db", 'marker'))
+    
+    if legend_items:
+        add_legend(m, legend_items)
+    
+    return render_map_html(m)
+
+
+def render():
+    """Render the page"""
+    st.title("🏘️ Neighborhood Overview")
+    st.markdown("Interactive map showing all neighborhoods, street lights, and suppliers")
+    
+    # Load data
+    with st.spinner("Loading data..."):
+        lights_df = get_lights_map()
+        neighborhoods_df = get_neighborhoods()
+        suppliers_df = get_suppliers()
+        status_counts = get_status_counts()
+    
+    # Metrics row (same single-row aggregate as the Live Demo page)
+    col1, col2, col3, col4 = st.columns(4)
+    
+    if not status_counts.empty:
+        counts = status_counts.iloc[0]
+        total_lights = int(counts['total'])
+        operational = int(counts['operational'])
+        faulty = int(counts['faulty'])
+        maintenance = int(counts['maintenance_required'])
+        # 0% when there are no lights
+        operational_pct = round(operational * 100 / (total_lights or 1), 1)
+        faulty_pct = round(faulty * 100 / (total_lights or 1), 1)
+        
+        col1.metric("Total Lights", f"{total_lights:,}")
+        col2.metric("Operational", f"{operational:,}", f"{operational_pct}%")
+        col3.metric("Faulty", f"{faulty:,}", f"-{faulty_pct}%", delta_color="inverse")
+        col4.metric("Maintenance Required", f"{maintenance:,}")
+    
+    st.markdown("---")
+    
+    # Filters and map rerun as a fragment so widget changes skip the page reload
+    @st.fragment
+    def overview_map(lights_df, neighborhoods_df, suppliers_df):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            selected_neighborhoods = st.multiselect(
+                "Filter by Neighborhood",
+                options=neighborhoods_df['name'].tolist() if not neighborhoods_df.empty else [],
+                default=[]
+            )
+        
+        with col2:
+            show_layers = st.multiselect(
+                "Map Layers",
+                options=["Neighborhoods", "Lights", "Suppliers"],
+                default=["Neighborhoods", "Lights", "Suppliers"]
+            )
+        
+        # Filter lights if neighborhoods selected (filtered in PostGIS)
+        if selected_neighborhoods:
+            lights_df = get_lights_map(tuple(selected_neighborhoods))
+        
+        if "Lights" in show_layers and len(lights_df) >= DECK_LIGHTS_THRESHOLD:
+            # Large light layers are drawn on the GPU with pydeck
+            st.pydeck_chart(
+                create_lights_deck(
+                    lights_df,
+                    neighborhoods_df if "Neighborhoods" in show_layers else None,
+                    suppliers_df if "Suppliers" in show_layers else None
+                ),
+                height=600
+            )
+            st.markdown(
+                " &nbsp; ".join(
+                    f"<span style='color: {STATUS_COLORS[status]};'>●</span> {label}"
+                    for status, label in [
+                        ('operational', "Operational"),
+                        ('maintenance_required', "Maintenance Required"),
+                        ('faulty', "Faulty")
+                    ]
+                ),
+                unsafe_allow_html=True
+            )
+        else:
+            # Display map (rebuilt only when the data or layers change)
+            show_map_html(
+                overview_map_html(lights_df, neighborhoods_df, suppliers_df, show_layers),
+                height=600
+            )
+    
+    overview_map(lights_df, neighborhoods_df, suppliers_df)
+    
+    # Stats table
+    st.markdown("### Neighborhood Statistics")
+    stats_df = get_neighborhood_stats()
+    if not stats_df.empty:
+        st.dataframe(
+            stats_df,
+            column_config={
+                'faulty_percentage': st.column_config.ProgressColumn(
+                    format='%.2f%%', min_value=0, max_value=100
+                )
+            },
+            width='stretch'
+        )
@@ -0,0 +1,614 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Predictive Maintenance page
+Snowflake ML forecasts with a PostGIS risk-score fallback
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from config import URGENCY_COLORS, PRIORITY_COLORS
+from db_utils import (
+    get_neighborhoods, get_predicted_failures, get_prediction_timeline,
+    get_seasonal_patterns,
+    # Snowflake ML functions
+    is_snowflake_available, is_forecast_trained, get_snowflake_forecast_bundle
+)
+from chart_utils import forecast_timeline_json
+from map_utils import (
+    create_base_map, add_neighborhoods_layer, add_predicted_failures_layer,
+    add_legend, add_fullscreen_control, render_map_html, show_map_html
+)
+
+
+# Rupee amounts in budget tables (formatted in the browser)
+INR_COLUMN = st.column_config.NumberColumn(format='₹%d')
+
+# CSS per priority/workload level, built once at import
+PRIORITY_CSS = {
+    level: f'background-color: {color}; color: white'
+    for level, color in PRIORITY_COLORS.items()
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def predictions_map_html(predictions_df, neighborhoods_df):
+    """
+    Build the predicted failures map and render it to HTML
+    Cached on the predictions and neighborhoods
+    """
+    m = create_base_map()
+    m = add_neighborhoods_layer(m, neighborhoods_df)
+    m = add_predicted_failures_layer(m, predictions_df)
+    m = add_fullscreen_control(m)
+    
+    # Legend for urgency
+    legend_items = [
+        ("CRITICAL (0-7 days)", URGENCY_COLORS['CRITICAL']),
+        ("HIGH (7-30 days)", URGENCY_COLORS['HIGH']),
+        ("MEDIUM (30-60 days)", URGENCY_COLORS['MEDIUM']),
+        ("LOW (60+ days)", URGENCY_COLORS['LOW'])
+    ]
+    add_legend(m, legend_items)
+    
+    return render_map_html(m)
+
+
+@st.cache_data(show_spinner=False)
+def priority_styles(display_df, priority_col):
+    """
+    Style matrix for the forecast table, coloring the priority/workload column
+    Built with one vectorized map instead of a per-row Styler callback
+    """
+    styles = pd.DataFrame('', index=display_df.index, columns=display_df.columns)
+    styles[priority_col] = (
+        display_df[priority_col].map(PRIORITY_CSS).astype(object)
+        .fillna('background-color: #ffffff; color: white')
+    )
+    return styles
+
+
+def color_urgency(col):
+    """Urgency cell styles for a whole column at once"""
+    colors = col.map(URGENCY_COLORS).astype(object).fillna('#ffffff')
+    return 'background-color: ' + colors + '; color: white'
+
+
+def render():
+    """Render the page"""
+    st.title("🔮 Predictive Maintenance")
+    
+    # Check if Snowflake is available
+    snowflake_connected = is_snowflake_available()
+    
+    if snowflake_connected:
+        # Forecast Type Selector
+        forecast_type = st.radio(
+            "Select Forecast Type",
+            options=["💡 Bulb Failures", "🔧 All Maintenance Issues"],
+            horizontal=True,
+            help="Choose between bulb failure predictions or total maintenance workload"
+        )
+        
+        if forecast_type == "💡 Bulb Failures":
+            st.markdown("**Bulb Failure Forecasts** powered by Snowflake ML")
+            st.caption("Predictions for bulb replacement needs based on historical failure patterns")
+        else:
+            st.markdown("**All Maintenance Issues Forecast** powered by Snowflake ML")
+            st.caption("Total maintenance workload predictions including all issue types")
+        
+        forecast_kind = "bulb" if forecast_type == "💡 Bulb Failures" else "all_issues"
+        
+        # Check if ML model has been trained (one-row probe, before loading forecasts)
+        if not is_forecast_trained(forecast_kind):
+            st.warning("⚠️ **ML Model Not Trained Yet**")
+            st.info(
+                """
+                The Snowflake ML forecast models need to be trained before predictions are available.
+                
+                **Please run the following SQL scripts in Snowflake (in order):**
+                
+                1. `snowflake/08_ml_training_view.sql` - Creates the training data views
+                2. `snowflake/09_ml_model_training.sql` - Trains BOTH forecast models and generates predictions
+                
+                **Quick steps:**
+                ```sql
+                -- Connect to Snowflake and run:
+                USE DATABASE STREETLIGHTS_DEMO;
+                USE SCHEMA ANALYTICS;
+                
+                -- Then execute the scripts above
+                ```
+                
+                After training completes (2-5 minutes for both models), refresh this page to see the predictions.
+                """
+            )
+            st.markdown("---")
+            st.markdown("### 📚 What the ML Models Do")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("""
+                **💡 Bulb Failure Model:**
+                - Predicts daily bulb replacements needed
+                - Optimizes bulb inventory
+                - ~50% of all maintenance requests
+                """)
+            with col2:
+                st.markdown("""
+                **🔧 All Issues Model:**
+                - Predicts total maintenance workload
+                - Includes: bulb, wiring, pole, power, sensors
+                - Full staffing and budget planning
+                """)
+            st.stop()  # Stop rendering the rest of the page
+        
+        # Load Snowflake forecast data based on selection
+        with st.spinner("Loading Snowflake ML predictions..."):
+            # One multi-statement Snowflake query for every table this page can show
+            forecast_bundle = get_snowflake_forecast_bundle(forecast_kind)
+            forecast_30d = forecast_bundle['forecast_30d']
+            forecast_metrics = forecast_bundle['metrics']
+        
+        # Key Metrics from Snowflake
+        st.markdown("### 📊 Forecast Summary")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        if not forecast_metrics.empty:
+            if forecast_type == "💡 Bulb Failures":
+                col1.metric(
+                    "Next 7 Days",
+                    f"{forecast_metrics.get('FORECAST_NEXT_7_DAYS', 'N/A')} failures",
+                    help="Expected bulb failures in the next 7 days"
+                )
+                col2.metric(
+                    "Next 30 Days",
+                    f"{forecast_metrics.get('FORECAST_NEXT_30_DAYS', 'N/A')} failures",
+                    help="Expected bulb failures in the next 30 days"
+                )
+                col3.metric(
+                    "High Priority Days",
+                    f"{forecast_metrics.get('HIGH_PRIORITY_DAYS', 'N/A')} days",
+                    help="Days requiring extra staffing in next 30 days"
+                )
+                col4.metric(
+                    "Bulbs to Order",
+                    f"{forecast_metrics.get('BULBS_TO_ORDER_30D', 'N/A')} units",
+                    help="Recommended inventory for next 30 days"
+                )
+            else:
+                col1.metric(
+                    "Next 7 Days",
+                    f"{forecast_metrics.get('TOTAL_REQUESTS_NEXT_7_DAYS', 'N/A')} requests",
+                    help="Expected total maintenance requests in the next 7 days"
+                )
+                col2.metric(
+                    "Next 30 Days",
+                    f"{forecast_metrics.get('TOTAL_REQUESTS_NEXT_30_DAYS', 'N/A')} requests",
+                    help="Expected total maintenance requests in the next 30 days"
+                )
+                col3.metric(
+                    "High Workload Days",
+                    f"{forecast_metrics.get('HIGH_WORKLOAD_DAYS', 'N/A')} days",
+                    help="Days with high workload in next 30 days"
+                )
+                col4.metric(
+                    "Parts to Stock",
+                    f"{forecast_metrics.get('TOTAL_PARTS_NEEDED', 'N/A')} units",
+                    help="Total parts (bulbs + wiring + poles) for next 30 days"
+                )
+        
+        st.markdown("---")
+        
+        # Controls for filtering
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if forecast_type == "💡 Bulb Failures":
+                priority_filter = st.multiselect(
+                    "Filter by Priority",
+                    options=["HIGH", "MEDIUM", "LOW"],
+                    default=["HIGH", "MEDIUM"]
+                )
+            else:
+                priority_filter = st.multiselect(
+                    "Filter by Workload Level",
+                    options=["HIGH", "MEDIUM", "LOW"],
+                    default=["HIGH", "MEDIUM"]
+                )
+        
+        with col2:
+            view_mode = st.radio(
+                "View Mode",
+                options=["Daily Schedule", "Weekly Summary", "Monthly Budget", "Issue Breakdown"] if forecast_type == "🔧 All Maintenance Issues" else ["Daily Schedule", "Weekly Summary", "Monthly Budget"],
+                horizontal=True
+            )
+        
+        # Filter data based on forecast type with a single mask
+        priority_col = 'PRIORITY' if forecast_type == "💡 Bulb Failures" else 'WORKLOAD_LEVEL'
+        filtered_forecast = forecast_30d
+        if priority_filter and not forecast_30d.empty:
+            filtered_forecast = forecast_30d.loc[forecast_30d[priority_col].isin(priority_filter)]
+        
+        st.markdown("---")
+        
+        if view_mode == "Daily Schedule":
+            if forecast_type == "💡 Bulb Failures":
+                st.markdown("### 📅 Daily Bulb Replacement Schedule")
+            else:
+                st.markdown("### 📅 Daily Maintenance Schedule")
+            
+            if not filtered_forecast.empty:
+                # Convert columns to proper format based on forecast type
+                if forecast_type == "💡 Bulb Failures":
+                    display_df = filtered_forecast[[
+                        'FORECAST_DATE', 'PREDICTED_FAILURES', 'LOWER_BOUND', 'UPPER_BOUND',
+                        'PRIORITY', 'STAFFING_RECOMMENDATION', 'BULBS_TO_STOCK', 'SEASON'
+                    ]]
+                else:
+                    display_df = filtered_forecast[[
+                        'FORECAST_DATE', 'PREDICTED_REQUESTS', 'LOWER_BOUND', 'UPPER_BOUND',
+                        'WORKLOAD_LEVEL', 'STAFFING_RECOMMENDATION', 'BULBS_TO_STOCK', 
+                        'WIRING_KITS_TO_STOCK', 'POLES_TO_STOCK', 'SEASON'
+                    ]]
+                
+                # Color code by priority/workload
+                styles = priority_styles(display_df, priority_col)
+                st.dataframe(
+                    display_df.style.apply(lambda _: styles, axis=None),
+                    width='stretch',
+                    height=400
+                )
+                
+                # Timeline chart
+                if forecast_type == "💡 Bulb Failures":
+                    st.markdown("### 📈 Bulb Failure Forecast Timeline")
+                    y_col = 'PREDICTED_FAILURES'
+                    y_label = 'Predicted Failures'
+                    chart_title = "Snowflake ML Forecast: Daily Bulb Failures"
+                else:
+                    st.markdown("### 📈 Total Maintenance Forecast Timeline")
+                    y_col = 'PREDICTED_REQUESTS'
+                    y_label = 'Predicted Requests'
+                    chart_title = "Snowflake ML Forecast: Daily Maintenance Requests"
+                
+                # Figure JSON is cached per filtered forecast, so reruns skip the build
+                fig = pio.from_json(
+                    forecast_timeline_json(filtered_forecast, y_col, y_label, chart_title)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No forecast data available for selected filters")
+        
+        elif view_mode == "Weekly Summary":
+            st.markdown("### 📊 Weekly Forecast Summary")
+            
+            if forecast_type == "💡 Bulb Failures":
+                weekly_df = forecast_bundle['weekly']
+                y_col = 'TOTAL_PREDICTED_FAILURES'
+                y_label = 'Total Failures'
+            else:
+                weekly_df = forecast_bundle['weekly']
+                y_col = 'TOTAL_PREDICTED_REQUESTS'
+                y_label = 'Total Requests'
+            
+            if not weekly_df.empty:
+                # Weekly table
+                st.dataframe(
+                    weekly_df,
+                    column_config={
+                        y_col: st.column_config.ProgressColumn(
+                            format='%d', min_value=0,
+                            max_value=float(weekly_df[y_col].max()) or 1.0
+                        )
+                    },
+                    width='stretch'
+                )
+                
+                # Weekly bar chart
+                fig = px.bar(
+                    weekly_df,
+                    x='WEEK_START',
+                    y=y_col,
+                    color='PRIMARY_SEASON',
+                    title=f"Weekly Predicted {y_label}",
+                    labels={
+                        y_col: y_label,
+                        'WEEK_START': 'Week Starting',
+                        'PRIMARY_SEASON': 'Season'
+                    }
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No weekly forecast data available")
+        
+        elif view_mode == "Monthly Budget":
+            st.markdown("### 💰 Monthly Budget Forecast")
+            
+            if forecast_type == "💡 Bulb Failures":
+                budget_df = forecast_bundle['monthly_budget']
+                
+                if not budget_df.empty:
+                    st.dataframe(
+                        budget_df,
+                        column_config={
+                            col: INR_COLUMN for col in [
+                                'MATERIAL_COST_INR', 'LABOR_COST_INR', 'TRANSPORT_COST_INR',
+                                'OVERHEAD_COST_INR', 'TOTAL_MONTHLY_BUDGET_INR'
+                            ]
+                        },
+                        width='stretch'
+                    )
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        fig = px.bar(
+                            budget_df,
+                            x='MONTH',
+                            y='TOTAL_MONTHLY_BUDGET_INR',
+                            title="Monthly Budget Forecast (INR)",
+                            labels={'TOTAL_MONTHLY_BUDGET_INR': 'Total Budget (₹)', 'MONTH': 'Month'}
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                    
+                    with col2:
+                        total_costs = {
+                            'Material': budget_df['MATERIAL_COST_INR'].sum(),
+                            'Labor': budget_df['LABOR_COST_INR'].sum(),
+                            'Transport': budget_df['TRANSPORT_COST_INR'].sum(),
+                            'Overhead': budget_df['OVERHEAD_COST_INR'].sum()
+                        }
+                        fig = px.pie(
+                            values=list(total_costs.values()),
+                            names=list(total_costs.keys()),
+                            title="Cost Distribution (Bulb Failures Only)"
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("No budget forecast data available")
+            else:
+                budget_df = forecast_bundle['monthly_budget']
+                
+                if not budget_df.empty:
+                    st.dataframe(
+                        budget_df,
+                        column_config={
+                            col: INR_COLUMN for col in [
+                                'BULB_COST_INR', 'WIRING_COST_INR', 'POLE_COST_INR',
+                                'LABOR_COST_INR', 'TRANSPORT_COST_INR', 'TOTAL_MONTHLY_BUDGET_INR'
+                            ]
+                        },
+                        width='stretch'
+                    )
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        fig = px.bar(
+                            budget_df,
+                            x='MONTH',
+                            y='TOTAL_MONTHLY_BUDGET_INR',
+                            title="Total Monthly Budget (All Issues)",
+                            labels={'TOTAL_MONTHLY_BUDGET_INR': 'Total Budget (₹)', 'MONTH': 'Month'}
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                    
+                    with col2:
+                        total_costs = {
+                            'Bulbs': budget_df['BULB_COST_INR'].sum(),
+                            'Wiring Kits': budget_df['WIRING_COST_INR'].sum(),
+                            'Poles': budget_df['POLE_COST_INR'].sum(),
+                            'Labor': budget_df['LABOR_COST_INR'].sum(),
+                            'Transport': budget_df['TRANSPORT_COST_INR'].sum()
+                        }
+                        fig = px.pie(
+                            values=list(total_costs.values()),
+                            names=list(total_costs.keys()),
+                            title="Cost Distribution (All Issues)"
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("No budget forecast data available")
+        
+        elif view_mode == "Issue Breakdown":
+            st.markdown("### 📊 Issue Type Breakdown")
+            
+            # Show forecast comparison
+            comparison_df = forecast_bundle['comparison']
+            issue_dist_df = forecast_bundle['issue_distribution']
+            
+            if not comparison_df.empty:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("#### Forecast Comparison (30 Days)")
+                    fig = go.Figure()
+                    
+                    fig.add_trace(go.Bar(
+                        x=comparison_df['FORECAST_DATE'],
+                        y=comparison_df['BULB_FAILURES'],
+                        name='Bulb Failures',
+                        marker_color='#3498db'
+                    ))
+                    fig.add_trace(go.Bar(
+                        x=comparison_df['FORECAST_DATE'],
+                        y=comparison_df['OTHER_ISSUES'],
+                        name='Other Issues',
+                        marker_color='#e74c3c'
+                    ))
+                    
+                    fig.update_layout(
+                        barmode='stack',
+                        title="Daily Breakdown: Bulb Failures vs Other Issues",
+                        xaxis_title="Date",
+                        yaxis_title="Number of Issues"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                with col2:
+                    st.markdown("#### Historical Issue Distribution")
+                    if not issue_dist_df.empty:
+                        fig = px.pie(
+                            issue_dist_df,
+                            values='TOTAL_COUNT',
+                            names='ISSUE_TYPE',
+                            title="Issue Types (Historical Data)"
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                
+                # Issue type details table
+                st.markdown("#### Issue Type Details")
+                if not issue_dist_df.empty:
+                    st.dataframe(
+                        issue_dist_df,
+                        column_config={
+                            'PERCENTAGE': st.column_config.ProgressColumn(
+                                format='%.1f%%', min_value=0, max_value=100
+                            )
+                        },
+                        width='stretch'
+                    )
+            else:
+                st.info("No comparison data available")
+        
+        # Seasonal Analysis
+        st.markdown("---")
+        st.markdown("### 🌦️ Seasonal Risk Analysis")
+        
+        seasonal_df = forecast_bundle['seasonal']
+        if not seasonal_df.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig = px.bar(
+                    seasonal_df,
+                    x='SEASON',
+                    y='AVG_DAILY_FAILURES',
+                    color='SEASONAL_RISK',
+                    color_discrete_map={
+                        'HIGH RISK': '#e74c3c',
+                        'MEDIUM RISK': '#f39c12',
+                        'LOW RISK': '#27ae60'
+                    },
+                    title="Average Daily Failures by Season",
+                    labels={'AVG_DAILY_FAILURES': 'Avg Daily Failures', 'SEASON': 'Season'}
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                st.dataframe(
+                    seasonal_df[['SEASON', 'TOTAL_FAILURES', 'AVG_DAILY_FAILURES', 'PEAK_DAY_FAILURES', 'SEASONAL_RISK']],
+                    width='stretch'
+                )
+    
+    else:
+        # Fallback to PostGIS predictions when Snowflake is not available
+        st.warning("⚠️ Snowflake ML not connected. Showing local PostGIS-based predictions.")
+        st.caption("Configure Snowflake credentials in `.streamlit/secrets.toml` for ML-powered forecasts")
+    st.markdown("Lights predicted to fail in the near future")
+    
+    # Controls, map, table and charts rerun as a fragment on widget changes
+    @st.fragment
+    def predictions_panel():
+        # Controls
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            days_ahead = st.slider("Prediction Window (days)", 7, 90, 30, 7)
+        
+        with col2:
+            urgency_filter = st.multiselect(
+                "Filter by Urgency",
+                options=["CRITICAL", "HIGH", "MEDIUM", "LOW"],
+                default=["CRITICAL", "HIGH", "MEDIUM"]
+            )
+        
+        # Load data
+        with st.spinner("Loading predictions..."):
+            predictions_df = get_predicted_failures(days_ahead, tuple(sorted(urgency_filter)))
+            neighborhoods_df = get_neighborhoods()
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        if not predictions_df.empty:
+            critical = len(predictions_df[predictions_df['maintenance_urgency'] == 'CRITICAL'])
+            high = len(predictions_df[predictions_df['maintenance_urgency'] == 'HIGH'])
+            medium = len(predictions_df[predictions_df['maintenance_urgency'] == 'MEDIUM'])
+            low = len(predictions_df[predictions_df['maintenance_urgency'] == 'LOW'])
+            
+            col1.metric("Critical", f"{critical:,}", delta_color="inverse")
+            col2.metric("High", f"{high:,}", delta_color="inverse")
+            col3.metric("Medium", f"{medium:,}")
+            col4.metric("Low", f"{low:,}")
+        else:
+            col1.info("No predictions in selected window")
+        
+        st.markdown("---")
+        
+        # Map
+        st.markdown("### Predicted Failures Map")
+        show_map_html(predictions_map_html(predictions_df, neighborhoods_df), height=500)
+        
+        # Table
+        st.markdown("### Prediction Details")
+        if not predictions_df.empty:
+            display_df = predictions_df[[
+                'light_id', 'neighborhood_name', 'predicted_failure_date',
+                'maintenance_urgency', 'failure_risk_score', 'season'
+            ]]
+            
+            # Color code urgency
+            st.dataframe(
+                display_df.style.apply(color_urgency, subset=['maintenance_urgency']),
+                width='stretch'
+            )
+            
+            # Timeline chart
+            st.markdown("### Predicted Failures Timeline")
+            timeline_df = get_prediction_timeline(days_ahead, tuple(sorted(urgency_filter)))
+            timeline_df['predicted_failure_date'] = pd.to_datetime(timeline_df['predicted_failure_date'])
+            
+            fig = px.line(timeline_df, x='predicted_failure_date', y='count',
+                         title=f"Predicted Failures Over Next {days_ahead} Days",
+                         labels={'count': 'Number of Predicted Failures', 
+                                'predicted_failure_date': 'Date'})
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Seasonal patterns
+            st.markdown("### Seasonal Failure Patterns")
+            seasonal_df = get_seasonal_patterns()
+            if not seasonal_df.empty:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    fig = px.bar(seasonal_df, x='season', y='request_count',
+                               title="Historical Maintenance Requests by Season",
+                               labels={'request_count': 'Number of Requests', 'season': 'Season'})
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                with col2:
+                    fig = px.bar(seasonal_df, x='season', y='avg_resolution_hours',
+                               title="Average Resolution Time by Season",
+                               labels={'avg_resolution_hours': 'Hours', 'season': 'Season'})
+                    st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No predictions match the selected criteria")
+    
+    predictions_panel()
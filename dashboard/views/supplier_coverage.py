@@ -0,0 +1,231 @@
+# Copyright 2025 Kamesh Sampath
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Supplier Coverage page
+Supplier service areas and neighborhood distances
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from matplotlib import colormaps
+
+from config import STATUS_COLORS
+from db_utils import (
+    get_sample_lights, get_neighborhoods, get_suppliers,
+    get_supplier_coverage, get_neighborhood_supplier_distance,
+    get_supplier_specialization_counts, get_supplier_radius_histogram,
+    load_concurrently
+)
+from map_utils import (
+    create_base_map, add_neighborhoods_layer, add_lights_layer,
+    add_suppliers_layer, add_legend, add_fullscreen_control,
+    add_neighborhood_supplier_lines, render_map_html, show_map_html
+)
+
+
+DISTANCE_CMAP = colormaps['RdYlGn_r']
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def supplier_map_html(suppliers_df, neighborhoods_df, neighborhood_dist, sample_lights):
+    """
+    Build the supplier coverage map and render it to HTML
+    Connection lines are drawn when neighborhood_dist is given
+    """
+    # Connection distance labels are SVG text paths, so skip the canvas renderer for them
+    show_connections = neighborhood_dist is not None
+    m = create_base_map(prefer_canvas=not show_connections)
+    m = add_neighborhoods_layer(m, neighborhoods_df)
+    m = add_suppliers_layer(m, suppliers_df)
+    
+    # Add connection lines if enabled
+    if show_connections and not neighborhood_dist.empty:
+        m = add_neighborhood_supplier_lines(m, neighborhood_dist, neighborhoods_df, suppliers_df)
+    
+    # Add some sample lights to show coverage (fixed sample to prevent flickering)
+    if not sample_lights.empty:
+        m = add_lights_layer(m, sample_lights)
+    
+    m = add_fullscreen_control(m)
+    
+    # Add legend
+    legend_items = [
+        ("Operational", STATUS_COLORS['operational'], 'circle'),
+        ("Maintenance Required", STATUS_COLORS['maintenance_required'], 'circle'),
+        ("Faulty", STATUS_COLORS['faulty'], 'circle'),
+        ("Supplier", "#3498db", 'marker')
+    ]
+    
+    if show_connections:
+        # Add a note about connection lines in the legend
+        legend_items.append(("Connection (to nearest supplier)", "#e74c3c", 'line'))
+    
+    add_legend(m, legend_items)
+    
+    return render_map_html(m)
+
+
+def distance_gradient(col):
+    """
+    Red-to-green background for a distance column, colored in one NumPy pass
+    Same colors and dark/light text switch as Styler.background_gradient
+    """
+    values = col.to_numpy(dtype=float)
+    low, high = np.nanmin(values), np.nanmax(values)
+    rgb = DISTANCE_CMAP((values - low) / ((high - low) or 1))[:, :3]
+    
+    # Relative luminance decides between light and dark text
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+    text = np.where(luminance < 0.408, '#f1f1f1', '#000000')
+    
+    channels = (rgb * 255).round().astype(np.uint8)
+    css = [
+        f'background-color: #{r:02x}{g:02x}{b:02x}; color: {t};'
+        for (r, g, b), t in zip(channels, text)
+    ]
+    return np.where(np.isnan(values), '', css)
+
+
+def render():
+    """Render the page"""
+    st.title("🏭 Supplier Coverage Analysis")
+    st.markdown("Analysis of supplier locations and service coverage")
+    
+    # Load data
+    with st.spinner("Loading supplier data..."):
+        # Independent queries run concurrently (one round-trip of wall time)
+        data = load_concurrently(
+            suppliers=get_suppliers,
+            coverage=get_supplier_coverage,
+            neighborhoods=get_neighborhoods,
+            spec_counts=get_supplier_specialization_counts,
+            radius_hist=get_supplier_radius_histogram,
+        )
+        suppliers_df = data['suppliers']
+        coverage_stats = data['coverage']
+        neighborhoods_df = data['neighborhoods']
+    
+    # Metrics
+    if not coverage_stats.empty:
+        col1, col2, col3, col4 = st.columns(4)
+        
+        stats = coverage_stats.iloc[0]
+        col1.metric("Total Suppliers", len(suppliers_df))
+        col2.metric("Lights within 5km", f"{stats['within_5km']:,}")
+        col3.metric("Lights within 10km", f"{stats['within_10km']:,}")
+        col4.metric("Avg Distance", f"{stats['avg_distance_km']:.2f} km")
+    
+    st.markdown("---")
+    
+    # Map
+    st.markdown("### Supplier Coverage Map")
+    
+    # Connection toggle and map rerun as a fragment
+    @st.fragment
+    def supplier_map(suppliers_df, neighborhoods_df):
+        # Add checkbox to show/hide connection lines
+        show_connections = st.checkbox("Show Neighborhood-Supplier Connections", value=True)
+        
+        neighborhood_dist = get_neighborhood_supplier_distance() if show_connections else None
+        sample_lights = get_sample_lights(500)
+        
+        show_map_html(
+            supplier_map_html(suppliers_df, neighborhoods_df, neighborhood_dist, sample_lights),
+            height=500
+        )
+    
+    supplier_map(suppliers_df, neighborhoods_df)
+    
+    # Supplier details table
+    st.markdown("### Supplier Details")
+    if not suppliers_df.empty:
+        display_df = suppliers_df[[
+            'name', 'specialization', 'service_radius_km', 
+            'avg_response_hours', 'contact_phone'
+        ]]
+        
+        st.dataframe(display_df, width='stretch')
+        
+        # Charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Specialization distribution (aggregated in SQL)
+            fig = px.pie(data['spec_counts'], values='count', names='specialization',
+                        title="Supplier Specialization Distribution")
+            st.plotly_chart(fig, width='stretch')
+        
+        with col2:
+            # Service radius distribution (pre-binned in SQL)
+            radius_hist = data['radius_hist']
+            fig = px.bar(radius_hist, x='radius_from_km', y='suppliers',
+                        title="Service Radius Distribution",
+                        labels={'radius_from_km': 'Service Radius from (km)', 
+                               'suppliers': 'Number of Suppliers'})
+            st.plotly_chart(fig, width='stretch')
+        
+        # Coverage analysis
+        st.markdown("### Coverage Analysis")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if not coverage_stats.empty:
+                stats = coverage_stats.iloc[0]
+                
+                coverage_data = pd.DataFrame({
+                    'Distance Range': ['Within 5km', '5-10km', 'Beyond 10km'],
+                    'Number of Lights': [stats['within_5km'], 
+                              stats['within_10km'] - stats['within_5km'],
+                              stats['beyond_10km']]
+                })
+                
+                fig = px.bar(coverage_data, x='Distance Range', y='Number of Lights',
+                            title="Lights by Distance to Nearest Supplier",
+                            color='Distance Range',
+                            color_discrete_map={
+                                'Within 5km': '#2ecc71',
+                                '5-10km': '#f39c12',
+                                'Beyond 10km': '#e74c3c'
+                            })
+                st.plotly_chart(fig, width='stretch')
+        
+        with col2:
+            # Neighborhood to supplier distances
+            neighborhood_dist = get_neighborhood_supplier_distance()
+            if not neighborhood_dist.empty:
+                fig = px.bar(neighborhood_dist, 
+                            x='neighborhood', 
+                            y='distance_km',
+                            title="Distance from Neighborhood to Nearest Supplier",
+                            labels={'distance_km': 'Distance (km)', 'neighborhood': 'Neighborhood'},
+                            hover_data=['nearest_supplier', 'specialization', 'lights_in_neighborhood'],
+                            color='distance_km',
+                            color_continuous_scale='RdYlGn_r')
+                fig.update_xaxes(tickangle=-45)
+                st.plotly_chart(fig, width='stretch')
+        
+        # Table showing neighborhood coverage details
+        st.markdown("### Neighborhood-Supplier Coverage Details")
+        neighborhood_dist = get_neighborhood_supplier_distance()
+        if not neighborhood_dist.empty:
+            st.dataframe(
+                neighborhood_dist.style.apply(distance_gradient, subset=['distance_km'])
+                                      .format({'distance_km': '{:.2f} km'}),
+                width='stretch'
+            )
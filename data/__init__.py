@@ -14,12 +14,7 @@
 
 """Data generation package for Street Lights Demo"""
 
-from data import generate_neighborhoods
-from data import generate_street_lights
-from data import generate_maintenance_history
-from data import generate_suppliers
-from data import generate_enrichment_data
-from data import generate_all
+import importlib
 
 __all__ = [
     "generate_neighborhoods",
@@ -30,3 +25,10 @@ __all__ = [
     "generate_all",
 ]
 
+
+def __getattr__(name):
+    """Import generator submodules on first access (PEP 562)"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -15,10 +15,11 @@
 
 """
 Generate all sample data for street lights demo
-Runs all data generators in the correct order
+Runs independent data generators in parallel, respecting their CSV dependencies
 """
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 
 # Import all the generator modules
@@ -31,8 +32,55 @@ from data import (
 )
 
 
+GENERATORS = {
+    "neighborhoods": generate_neighborhoods.main,
+    "suppliers": generate_suppliers.main,
+    "street lights": generate_street_lights.main,
+    "maintenance history": generate_maintenance_history.main,
+    "enrichment data": generate_enrichment_data.main,
+}
+
+# Generator -> generators whose CSV output it reads
+GENERATOR_DEPENDENCIES = {
+    "neighborhoods": [],
+    "suppliers": [],
+    "street lights": ["neighborhoods"],
+    "maintenance history": ["street lights"],
+    "enrichment data": ["neighborhoods", "street lights"],
+}
+
+
+def run_generators(generators, dependencies):
+    """
+    Run generators on a process pool
+    Each one is submitted as soon as all of its dependencies have finished
+    """
+    done = set()
+    running = {}
+    workers = min(len(generators), os.cpu_count() or 1)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while len(done) < len(generators):
+            for name, func in generators.items():
+                ready = all(dep in done for dep in dependencies[name])
+                if name not in done and name not in running.values() and ready:
+                    print(f"→ Started {name}")
+                    running[pool.submit(func)] = name
+            
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error generating {name}: {e}", file=sys.stderr)
+                    sys.exit(1)
+                print(f"✓ Finished {name} ({len(done) + 1}/{len(generators)})")
+                done.add(name)
+
+
 def main():
-    """Run all data generators in sequence"""
+    """Run all data generators (independent ones in parallel)"""
     print("=" * 50)
     print("Street Lights Demo - Data Generation")
     print("=" * 50)
@@ -45,25 +93,12 @@ def main():
     print(f"Working directory: {data_dir}")
     print()
     
-    generators = [
-        ("neighborhoods", generate_neighborhoods.main),
-        ("street lights", generate_street_lights.main),
-        ("maintenance history", generate_maintenance_history.main),
-        ("suppliers", generate_suppliers.main),
-        ("enrichment data", generate_enrichment_data.main),
-    ]
-    
     try:
-        for i, (name, func) in enumerate(generators, 1):
-            print(f"Step {i}/{len(generators)}: Generating {name}...")
-            try:
-                func()
-                print()
-            except Exception as e:
-                print(f"Error generating {name}: {e}", file=sys.stderr)
-                sys.exit(1)
+        # Worker processes start in the data directory, so CSVs land there too
+        run_generators(GENERATORS, GENERATOR_DEPENDENCIES)
+        print()
     finally:
-        # Restore original directory
+        # Restore original directory once every generator has finished
         os.chdir(original_dir)
     
     # Summary
@@ -73,7 +108,12 @@ def main():
     print()
     print("Generated files in data/ directory:")
     
-    data_dir = Path(__file__).parent
+    # One directory read for every file size
+    sizes = {
+        entry.name: entry.stat().st_size
+        for entry in os.scandir(data_dir)
+        if entry.is_file()
+    }
     # List full dataset files (not sample_*)
     full_files = [
         "neighborhoods.csv",
@@ -85,11 +125,8 @@ def main():
         "power_grid_enrichment.csv",
     ]
     for filename in full_files:
-        csv_file = data_dir / filename
-        if csv_file.exists():
-            size = csv_file.stat().st_size
-            size_kb = size / 1024
-            print(f"  {filename} ({size_kb:.1f} KB)")
+        if filename in sizes:
+            print(f"  {filename} ({sizes[filename] / 1024:.1f} KB)")
     
     print()
     print("Next steps:")
@@ -21,9 +21,11 @@ Output: maintenance_requests.csv
 """
 
 import csv
-import random
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 # Realistic free-text descriptions for each issue type
 # These varied descriptions enable semantic search capabilities
 DESCRIPTIONS = {
@@ -143,22 +145,24 @@ SEASON_CONTEXT = {
 }
 
 
+# CSV columns, in the order of each generated request tuple
+FIELDNAMES = ['request_id', 'light_id', 'reported_at', 'resolved_at', 'issue_type', 'description']
+
+
 def load_street_lights(filename='street_lights.csv'):
-    """Load street lights from CSV"""
-    lights = []
-    with open(filename, 'r') as csvfile:
-        reader = csv.DictReader(csvfile)
-        lights = list(reader)
-    return lights
+    """Load street lights from CSV (only light_id is needed, read with pandas' C parser)"""
+    return pd.read_csv(filename, usecols=['light_id'], dtype=str)
+
+# Season for each month number (index 0 unused): Mar-May summer, Jun-Sep monsoon
+SEASON_BY_MONTH = (
+    None,
+    'winter', 'winter', 'summer', 'summer', 'summer', 'monsoon',
+    'monsoon', 'monsoon', 'monsoon', 'winter', 'winter', 'winter',
+)
 
 def get_season(month):
     """Determine season from month"""
-    if 6 <= month <= 9:
-        return 'monsoon'
-    elif 3 <= month <= 5:
-        return 'summer'
-    else:
-        return 'winter'
+    return SEASON_BY_MONTH[month]
 
 def get_seasonal_failure_weight(season):
     """Higher weights = more failures in that season"""
@@ -169,15 +173,14 @@ def get_seasonal_failure_weight(season):
     }
     return weights[season]
 
-def generate_description(issue_type, season):
-    """Generate a realistic free-text description for the issue"""
-    base_description = random.choice(DESCRIPTIONS.get(issue_type, DESCRIPTIONS['bulb_failure']))
-    season_context = random.choice(SEASON_CONTEXT.get(season, [""]))
-    return base_description + season_context
-
 def generate_maintenance_requests(lights, count=1500):
-    """Generate maintenance request history"""
-    requests = []
+    """
+    Generate maintenance request history (every column drawn as one NumPy array)
+    lights is a DataFrame with a light_id column (see load_street_lights)
+    Returns (requests, months): requests are row tuples in FIELDNAMES order
+    and months[i] is the report month of requests[i]
+    """
+    rng = np.random.default_rng()
     
     # Issue types with probabilities (bulb_failure is ~50% for better ML training)
     issue_types = [
@@ -192,57 +195,74 @@ def generate_maintenance_requests(lights, count=1500):
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365)
     
-    # Build seasonal distribution
-    seasonal_slots = []
-    current = start_date
-    while current < end_date:
-        season = get_season(current.month)
-        weight = get_seasonal_failure_weight(season)
-        # Add more slots for seasons with higher failure rates
-        for _ in range(int(weight * 10)):
-            seasonal_slots.append(current)
-        current += timedelta(days=1)
+    # One day per entry; seasons looked up per month instead of per day or request
+    days = np.datetime64(start_date, 's') + np.arange((end_date - start_date).days).astype('timedelta64[D]')
+    season_by_month = np.array(SEASON_BY_MONTH[1:])
     
-    # Sample from seasonal slots
-    selected_dates = random.sample(seasonal_slots, min(count, len(seasonal_slots)))
-    selected_dates.sort()
+    # Each day holds weight * 10 request slots (more in high-failure seasons).
+    # Drawing count slots without replacement is a multivariate hypergeometric
+    # draw of per-day counts, so the slots never need to be materialized.
+    slots_by_month = np.array([int(get_seasonal_failure_weight(season) * 10) for season in season_by_month])
+    day_slots = slots_by_month[days.astype('datetime64[M]').astype(np.int64) % 12]
+    per_day = rng.multivariate_hypergeometric(day_slots, min(count, int(day_slots.sum())))
     
-    for i, reported_at in enumerate(selected_dates):
-        request_id = f"REQ-{i+1:04d}"
-        light = random.choice(lights)
-        light_id = light['light_id']
-        issue_type = random.choice(issue_types)
-        season = get_season(reported_at.month)
-        
-        # Generate realistic free-text description
-        description = generate_description(issue_type, season)
-        
-        # Resolution time: 1-7 days (most resolved within 3 days)
-        resolution_days = random.choices([1, 2, 3, 4, 5, 6, 7], weights=[10, 20, 30, 20, 10, 5, 5])[0]
-        resolved_at = reported_at + timedelta(days=resolution_days, hours=random.randint(1, 8))
-        
-        # 5% of requests are still open (unresolved)
-        if random.random() < 0.05:
-            resolved_at = None
-        
-        requests.append({
-            'request_id': request_id,
-            'light_id': light_id,
-            'reported_at': reported_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'resolved_at': resolved_at.strftime('%Y-%m-%d %H:%M:%S') if resolved_at else '',
-            'issue_type': issue_type,
-            'description': description
-        })
+    # Days are already in order, so the requests come out sorted
+    reported = np.repeat(days, per_day)
+    n = len(reported)
+    months = reported.astype('datetime64[M]').astype(np.int64) % 12 + 1
+    seasons = season_by_month[months - 1]
     
-    return requests
+    light_ids = lights['light_id'].to_numpy()[rng.integers(0, len(lights), size=n)]
+    issues = rng.choice(np.array(issue_types), size=n)
+    
+    # Free-text description picks (any list length per issue type / season)
+    description_counts = {issue: len(texts) for issue, texts in DESCRIPTIONS.items()}
+    context_counts = {season: len(texts) for season, texts in SEASON_CONTEXT.items()}
+    description_picks = (rng.random(n) * [description_counts[issue] for issue in issues]).astype(int)
+    context_picks = (rng.random(n) * [context_counts[season] for season in seasons]).astype(int)
+    
+    # Resolution time: 1-7 days (most resolved within 3 days) plus 1-8 hours
+    day_weights = np.array([10, 20, 30, 20, 10, 5, 5], dtype=float)
+    resolution_days = rng.choice(np.arange(1, 8), size=n, p=day_weights / day_weights.sum())
+    resolution_hours = rng.integers(1, 9, size=n)
+    resolved = (
+        reported
+        + resolution_days.astype('timedelta64[D]')
+        + resolution_hours.astype('timedelta64[h]')
+    )
+    
+    # 5% of requests are still open (unresolved)
+    is_open = rng.random(n) < 0.05
+    
+    reported_text = np.char.replace(np.datetime_as_string(reported, unit='s'), 'T', ' ')
+    resolved_text = np.where(
+        is_open, '', np.char.replace(np.datetime_as_string(resolved, unit='s'), 'T', ' ')
+    )
+    
+    request_ids = np.char.add('REQ-', np.char.zfill(np.arange(1, n + 1).astype(str), 4))
+    
+    requests = [
+        (
+            request_id,
+            light_id,
+            reported_at,
+            resolved_at,
+            issue,
+            DESCRIPTIONS[issue][description_pick] + SEASON_CONTEXT[season][context_pick]
+        )
+        for request_id, light_id, reported_at, resolved_at, issue, season, description_pick, context_pick
+        in zip(
+            request_ids.tolist(), light_ids.tolist(), reported_text.tolist(), resolved_text.tolist(),
+            issues.tolist(), seasons.tolist(), description_picks.tolist(), context_picks.tolist()
+        )
+    ]
+    return requests, months.tolist()
 
 def save_to_csv(requests, filename='maintenance_requests.csv'):
-    """Save requests to CSV file"""
-    fieldnames = ['request_id', 'light_id', 'reported_at', 'resolved_at', 'issue_type', 'description']
-    
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    """Save request row tuples to CSV file (one large write buffer)"""
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
         writer.writerows(requests)
     
     print(f"✓ Generated {len(requests)} maintenance requests")
@@ -256,7 +276,7 @@ def main():
     
     print("\nGenerating maintenance request history...")
     # Using 1500 requests for better ML forecasting patterns (~1.5 failures/day)
-    requests = generate_maintenance_requests(lights, count=1500)
+    requests, months = generate_maintenance_requests(lights, count=1500)
     save_to_csv(requests)
     
     # Print summary
@@ -264,15 +284,13 @@ def main():
     open_count = 0
     issue_type_counts = {}
     
-    for req in requests:
-        reported_dt = datetime.strptime(req['reported_at'], '%Y-%m-%d %H:%M:%S')
-        season = get_season(reported_dt.month)
-        by_season[season] += 1
+    # Report months come from generation, so no timestamps are re-parsed
+    for (_, _, _, resolved_at, issue_type, _), month in zip(requests, months):
+        by_season[get_season(month)] += 1
         
-        if not req['resolved_at']:
+        if not resolved_at:
             open_count += 1
         
-        issue_type = req['issue_type']
         issue_type_counts[issue_type] = issue_type_counts.get(issue_type, 0) + 1
     
     print(f"\nSummary:")
@@ -37,6 +37,12 @@ SELECT COUNT(*) AS neighborhoods_loaded FROM streetlights.neighborhoods;
 \echo '2. Loading street lights...'
 \copy streetlights.street_lights(light_id, location, status, wattage, installation_date, last_maintenance, neighborhood_id) FROM 'data/street_lights.csv' WITH (FORMAT csv, HEADER true);
 SELECT COUNT(*) AS lights_loaded FROM streetlights.street_lights;
+-- Backfill any light loaded without a neighborhood from its boundary
+UPDATE streetlights.street_lights l
+SET neighborhood_id = n.neighborhood_id
+FROM streetlights.neighborhoods n
+WHERE l.neighborhood_id IS NULL
+  AND ST_Within(l.location, n.boundary);
 
 -- Load maintenance requests
 \echo ''
@@ -70,6 +76,14 @@ SELECT COUNT(*) AS demographics_records_loaded FROM streetlights.demographics_en
 \copy streetlights.power_grid_enrichment(light_id, grid_zone, avg_load_percent, outage_history_count) FROM 'data/power_grid_enrichment.csv' WITH (FORMAT csv, HEADER true);
 SELECT COUNT(*) AS power_grid_records_loaded FROM streetlights.power_grid_enrichment;
 
+-- Refresh dashboard materialized views
+\echo ''
+\echo '8. Refreshing materialized views...'
+REFRESH MATERIALIZED VIEW streetlights.mv_street_lights_enriched;
+REFRESH MATERIALIZED VIEW streetlights.mv_neighborhood_stats;
+REFRESH MATERIALIZED VIEW streetlights.mv_faulty_lights_with_supplier;
+REFRESH MATERIALIZED VIEW streetlights.mv_seasonal_patterns;
+
 -- Data validation queries
 \echo ''
 \echo '============================================'
@@ -113,8 +127,8 @@ LIMIT 10;
 \echo 'Maintenance requests summary:'
 SELECT 
     COUNT(*) AS total_requests,
-    COUNT(CASE WHEN resolved_at IS NULL THEN 1 END) AS open_requests,
-    COUNT(CASE WHEN resolved_at IS NOT NULL THEN 1 END) AS closed_requests
+    COUNT(*) FILTER (WHERE resolved_at IS NULL) AS open_requests,
+    COUNT(*) FILTER (WHERE resolved_at IS NOT NULL) AS closed_requests
 FROM streetlights.maintenance_requests;
 
 -- Enrichment coverage
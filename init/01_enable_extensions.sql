@@ -32,6 +32,9 @@ CREATE EXTENSION IF NOT EXISTS vector;
 -- Enable PostGIS topology (optional but useful for advanced spatial operations)
 CREATE EXTENSION IF NOT EXISTS postgis_topology;
 
+-- Enable row-count table sampling (TABLESAMPLE SYSTEM_ROWS) used by the demo controls
+CREATE EXTENSION IF NOT EXISTS tsm_system_rows;
+
 -- Verify installation and show version
 SELECT PostGIS_Version() as postgis_version;
 
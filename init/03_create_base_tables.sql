@@ -25,17 +25,26 @@ CREATE TABLE IF NOT EXISTS streetlights.neighborhoods (
     name TEXT NOT NULL,
     boundary GEOMETRY(Polygon, 4326) NOT NULL,
     population INTEGER,
+    -- ~10 m simplification and 5 decimals are lossless at dashboard zoom
+    boundary_geojson TEXT GENERATED ALWAYS AS (
+        ST_AsGeoJSON(ST_SimplifyPreserveTopology(boundary, 0.0001), 5)
+    ) STORED,
+    center GEOGRAPHY(Point, 4326) GENERATED ALWAYS AS (ST_Centroid(boundary)::geography) STORED,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 COMMENT ON TABLE streetlights.neighborhoods IS 'City neighborhoods with geographic boundaries';
 COMMENT ON COLUMN streetlights.neighborhoods.boundary IS 'Polygon boundary in WGS84 (SRID 4326)';
+COMMENT ON COLUMN streetlights.neighborhoods.boundary_geojson IS 'Simplified boundary as GeoJSON, maintained from boundary for the dashboard';
+COMMENT ON COLUMN streetlights.neighborhoods.center IS 'Generated boundary centroid as geography for distance queries';
 
 -- Table: street_lights
 -- Operational data for all street lights
 CREATE TABLE IF NOT EXISTS streetlights.street_lights (
     light_id TEXT PRIMARY KEY,
     location GEOMETRY(Point, 4326) NOT NULL,
+    -- Geography copy of location for metre distances without a per-row cast
+    location_geog GEOGRAPHY(Point, 4326) GENERATED ALWAYS AS (location::geography) STORED,
     status TEXT NOT NULL CHECK (status IN ('operational', 'faulty', 'maintenance_required')),
     wattage INTEGER,
     installation_date DATE,
@@ -47,6 +56,7 @@ CREATE TABLE IF NOT EXISTS streetlights.street_lights (
 
 COMMENT ON TABLE streetlights.street_lights IS 'Street lights with spatial locations and operational status';
 COMMENT ON COLUMN streetlights.street_lights.location IS 'GPS coordinates in WGS84 (SRID 4326)';
+COMMENT ON COLUMN streetlights.street_lights.location_geog IS 'Generated geography copy of location for distance queries';
 COMMENT ON COLUMN streetlights.street_lights.status IS 'Current operational status: operational, faulty, or maintenance_required';
 
 -- Table: maintenance_requests
@@ -71,6 +81,7 @@ CREATE TABLE IF NOT EXISTS streetlights.suppliers (
     supplier_id TEXT PRIMARY KEY,
     name TEXT NOT NULL,
     location GEOMETRY(Point, 4326) NOT NULL,
+    location_geog GEOGRAPHY(Point, 4326) GENERATED ALWAYS AS (location::geography) STORED,
     contact_phone TEXT,
     service_radius_km INTEGER,
     avg_response_hours INTEGER,
@@ -80,6 +91,7 @@ CREATE TABLE IF NOT EXISTS streetlights.suppliers (
 
 COMMENT ON TABLE streetlights.suppliers IS 'Light equipment suppliers with service coverage areas';
 COMMENT ON COLUMN streetlights.suppliers.location IS 'Supplier office location in WGS84 (SRID 4326)';
+COMMENT ON COLUMN streetlights.suppliers.location_geog IS 'Generated geography copy of location for distance and KNN queries';
 COMMENT ON COLUMN streetlights.suppliers.service_radius_km IS 'Maximum service coverage radius in kilometers';
 
 -- Trigger to update updated_at timestamp on street_lights
@@ -98,6 +110,28 @@ BEFORE UPDATE ON streetlights.street_lights
 FOR EACH ROW
 EXECUTE FUNCTION streetlights.update_updated_at_column();
 
+-- Trigger to fill street_lights.neighborhood_id from the boundary it falls in
+-- Lets per-neighborhood rollups join on neighborhood_id instead of ST_Within
+CREATE OR REPLACE FUNCTION streetlights.assign_light_neighborhood()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.neighborhood_id IS NULL THEN
+        SELECT n.neighborhood_id INTO NEW.neighborhood_id
+        FROM streetlights.neighborhoods n
+        WHERE ST_Within(NEW.location, n.boundary)
+        LIMIT 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS assign_street_lights_neighborhood ON streetlights.street_lights;
+
+CREATE TRIGGER assign_street_lights_neighborhood
+BEFORE INSERT OR UPDATE OF location, neighborhood_id ON streetlights.street_lights
+FOR EACH ROW
+EXECUTE FUNCTION streetlights.assign_light_neighborhood();
+
 -- Log completion
 DO $$
 BEGIN
@@ -65,6 +65,83 @@ COMMENT ON COLUMN streetlights.power_grid_enrichment.grid_zone IS 'Power grid zo
 COMMENT ON COLUMN streetlights.power_grid_enrichment.avg_load_percent IS 'Average grid load percentage (0-100)';
 COMMENT ON COLUMN streetlights.power_grid_enrichment.outage_history_count IS 'Number of historical power outages';
 
+-- Table: light_nearest_supplier
+-- Nearest supplier per light, kept current by triggers instead of a KNN per query
+CREATE TABLE IF NOT EXISTS streetlights.light_nearest_supplier (
+    light_id TEXT PRIMARY KEY REFERENCES streetlights.street_lights(light_id) ON DELETE CASCADE,
+    supplier_id TEXT NOT NULL REFERENCES streetlights.suppliers(supplier_id) ON DELETE CASCADE,
+    distance_km DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_light_nearest_supplier_supplier
+    ON streetlights.light_nearest_supplier(supplier_id);
+
+COMMENT ON TABLE streetlights.light_nearest_supplier IS 'Derived nearest supplier for each light (maintained by triggers)';
+COMMENT ON COLUMN streetlights.light_nearest_supplier.distance_km IS 'Geodesic distance from the light to the supplier in kilometers';
+
+-- Assign the nearest supplier to one light, or to every light when p_light_id is NULL
+-- Only rows whose assignment changed are written
+CREATE OR REPLACE FUNCTION streetlights.assign_nearest_suppliers(p_light_id TEXT DEFAULT NULL)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO streetlights.light_nearest_supplier (light_id, supplier_id, distance_km)
+    SELECT 
+        l.light_id,
+        s.supplier_id,
+        ST_Distance(s.location_geog, l.location_geog) / 1000
+    FROM streetlights.street_lights l
+    CROSS JOIN LATERAL (
+        SELECT supplier_id, location_geog
+        FROM streetlights.suppliers
+        ORDER BY location_geog <-> l.location_geog
+        LIMIT 1
+    ) s
+    WHERE p_light_id IS NULL OR l.light_id = p_light_id
+    ON CONFLICT (light_id) DO UPDATE
+    SET supplier_id = EXCLUDED.supplier_id,
+        distance_km = EXCLUDED.distance_km,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (light_nearest_supplier.supplier_id, light_nearest_supplier.distance_km)
+        IS DISTINCT FROM (EXCLUDED.supplier_id, EXCLUDED.distance_km);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION streetlights.assign_nearest_suppliers(TEXT) IS 'Recompute light_nearest_supplier for one light or all lights';
+
+-- Trigger: a new or moved light gets its nearest supplier
+CREATE OR REPLACE FUNCTION streetlights.assign_light_nearest_supplier()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM streetlights.assign_nearest_suppliers(NEW.light_id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS assign_street_lights_nearest_supplier ON streetlights.street_lights;
+
+CREATE TRIGGER assign_street_lights_nearest_supplier
+AFTER INSERT OR UPDATE OF location ON streetlights.street_lights
+FOR EACH ROW
+EXECUTE FUNCTION streetlights.assign_light_nearest_supplier();
+
+-- Trigger: any supplier change reassigns all lights once per statement
+-- (deleted suppliers' rows are removed by the cascade first, then re-added)
+CREATE OR REPLACE FUNCTION streetlights.reassign_nearest_suppliers()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM streetlights.assign_nearest_suppliers();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS reassign_suppliers_nearest ON streetlights.suppliers;
+
+CREATE TRIGGER reassign_suppliers_nearest
+AFTER INSERT OR UPDATE OF location OR DELETE ON streetlights.suppliers
+FOR EACH STATEMENT
+EXECUTE FUNCTION streetlights.reassign_nearest_suppliers();
+
 -- Log completion
 DO $$
 BEGIN
@@ -72,6 +149,7 @@ BEGIN
     RAISE NOTICE '  - weather_enrichment (seasonal patterns)';
     RAISE NOTICE '  - demographics_enrichment (neighborhood data)';
     RAISE NOTICE '  - power_grid_enrichment (electrical grid data)';
+    RAISE NOTICE '  - light_nearest_supplier (derived, maintained by triggers)';
     RAISE NOTICE 'Note: These tables will be populated by data generation scripts';
 END $$;
 
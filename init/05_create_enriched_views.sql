@@ -90,6 +90,41 @@ LEFT JOIN streetlights.power_grid_enrichment p ON l.light_id = p.light_id;
 
 COMMENT ON VIEW streetlights.street_lights_enriched IS 'Enriched view combining lights with all contextual data (current season)';
 
+-- Materialized view: mv_street_lights_enriched
+-- Snapshot of street_lights_enriched for the dashboard's hot reads
+-- Season, age and urgency depend on CURRENT_DATE, so snapshot_date records the day they were computed
+CREATE MATERIALIZED VIEW IF NOT EXISTS streetlights.mv_street_lights_enriched AS
+SELECT e.*, CURRENT_DATE as snapshot_date
+FROM streetlights.street_lights_enriched e;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_lights_enriched_light
+    ON streetlights.mv_street_lights_enriched(light_id);
+CREATE INDEX IF NOT EXISTS idx_mv_lights_enriched_status
+    ON streetlights.mv_street_lights_enriched(status);
+CREATE INDEX IF NOT EXISTS idx_mv_lights_enriched_predicted
+    ON streetlights.mv_street_lights_enriched(predicted_failure_date);
+CREATE INDEX IF NOT EXISTS idx_mv_lights_enriched_location
+    ON streetlights.mv_street_lights_enriched USING GIST(location);
+
+COMMENT ON MATERIALIZED VIEW streetlights.mv_street_lights_enriched IS 'Indexed snapshot of street_lights_enriched read by the dashboard';
+
+-- Refresh the enriched snapshot (always, or only when it was taken on an earlier day)
+CREATE OR REPLACE FUNCTION streetlights.refresh_enriched_lights(p_force BOOLEAN DEFAULT TRUE)
+RETURNS VOID AS $$
+BEGIN
+    IF p_force OR NOT EXISTS (
+        SELECT 1 FROM streetlights.mv_street_lights_enriched
+        WHERE snapshot_date = CURRENT_DATE
+        LIMIT 1
+    ) THEN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY streetlights.mv_street_lights_enriched;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION streetlights.refresh_enriched_lights(BOOLEAN) IS 'Refresh mv_street_lights_enriched; with FALSE only if the snapshot is from an earlier day';
+
 -- View: maintenance_requests_enriched
 -- Combines maintenance requests with spatial and enrichment context
 CREATE OR REPLACE VIEW streetlights.maintenance_requests_enriched AS
@@ -150,6 +185,79 @@ LEFT JOIN streetlights.weather_enrichment w ON l.light_id = w.light_id
 
 COMMENT ON VIEW streetlights.maintenance_requests_enriched IS 'Maintenance requests with spatial and enrichment context';
 
+-- Materialized view: mv_neighborhood_stats
+-- Light counts by status per neighborhood (dashboard overview)
+-- Refreshed after data loads and by the dashboard's demo writes
+CREATE MATERIALIZED VIEW IF NOT EXISTS streetlights.mv_neighborhood_stats AS
+SELECT 
+    n.name as neighborhood,
+    COUNT(l.light_id) as total_lights,
+    COUNT(*) FILTER (WHERE l.status = 'operational') as operational,
+    COUNT(*) FILTER (WHERE l.status = 'maintenance_required') as maintenance_required,
+    COUNT(*) FILTER (WHERE l.status = 'faulty') as faulty,
+    ROUND(
+        COUNT(*) FILTER (WHERE l.status = 'faulty') * 100.0 / 
+        NULLIF(COUNT(l.light_id), 0), 
+        2
+    ) as faulty_percentage
+FROM streetlights.neighborhoods n
+-- neighborhood_id is assigned from the boundary on insert (assign_light_neighborhood)
+LEFT JOIN streetlights.street_lights l ON l.neighborhood_id = n.neighborhood_id
+GROUP BY n.name;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_neighborhood_stats_neighborhood
+    ON streetlights.mv_neighborhood_stats(neighborhood);
+
+COMMENT ON MATERIALIZED VIEW streetlights.mv_neighborhood_stats IS 'Precomputed light status counts per neighborhood';
+
+-- Materialized view: mv_faulty_lights_with_supplier
+-- Faulty lights with their nearest supplier (faulty lights analysis)
+-- Refreshed after data loads and by the dashboard's demo writes
+CREATE MATERIALIZED VIEW IF NOT EXISTS streetlights.mv_faulty_lights_with_supplier AS
+SELECT 
+    l.light_id,
+    ST_X(l.location) as longitude,
+    ST_Y(l.location) as latitude,
+    l.status,
+    n.name as neighborhood,
+    s.name as nearest_supplier,
+    s.specialization,
+    ROUND(ns.distance_km::numeric, 2) as distance_km,
+    s.avg_response_hours,
+    s.contact_phone
+FROM streetlights.street_lights l
+LEFT JOIN streetlights.neighborhoods n ON l.neighborhood_id = n.neighborhood_id
+-- Nearest supplier is precomputed per light (see light_nearest_supplier)
+JOIN streetlights.light_nearest_supplier ns ON ns.light_id = l.light_id
+JOIN streetlights.suppliers s ON s.supplier_id = ns.supplier_id
+WHERE l.status = 'faulty';
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_faulty_lights_light
+    ON streetlights.mv_faulty_lights_with_supplier(light_id);
+CREATE INDEX IF NOT EXISTS idx_mv_faulty_lights_distance
+    ON streetlights.mv_faulty_lights_with_supplier(distance_km);
+
+COMMENT ON MATERIALIZED VIEW streetlights.mv_faulty_lights_with_supplier IS 'Precomputed nearest supplier for every faulty light';
+
+-- Materialized view: mv_seasonal_patterns
+-- Resolved maintenance request counts and resolution times per season
+-- Maintenance requests only change on data loads, so it is refreshed there
+CREATE MATERIALIZED VIEW IF NOT EXISTS streetlights.mv_seasonal_patterns AS
+SELECT 
+    season,
+    COUNT(*) as request_count,
+    AVG(resolution_hours) as avg_resolution_hours
+FROM streetlights.maintenance_requests_enriched
+WHERE resolved_at IS NOT NULL
+GROUP BY season;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_seasonal_patterns_season
+    ON streetlights.mv_seasonal_patterns(season);
+
+COMMENT ON MATERIALIZED VIEW streetlights.mv_seasonal_patterns IS 'Precomputed maintenance patterns by season';
+
 -- Create function to get nearest supplier for a light
 CREATE OR REPLACE FUNCTION streetlights.get_nearest_supplier(p_light_id TEXT)
 RETURNS TABLE (
@@ -165,14 +273,14 @@ BEGIN
     SELECT 
         s.supplier_id,
         s.name as supplier_name,
-        ROUND((ST_Distance(s.location::geography, l.location::geography) / 1000.0)::numeric, 2) as distance_km,
+        ROUND((ST_Distance(s.location_geog, l.location_geog) / 1000.0)::numeric, 2) as distance_km,
         s.contact_phone,
         s.avg_response_hours,
         s.specialization
     FROM streetlights.suppliers s
     CROSS JOIN streetlights.street_lights l
     WHERE l.light_id = p_light_id
-    ORDER BY s.location <-> l.location
+    ORDER BY s.location_geog <-> l.location_geog
     LIMIT 1;
 END;
 $$ LANGUAGE plpgsql;
@@ -185,8 +293,14 @@ BEGIN
     RAISE NOTICE 'Enriched views created successfully!';
     RAISE NOTICE '  - street_lights_enriched (main CDC capture view)';
     RAISE NOTICE '  - maintenance_requests_enriched';
+    RAISE NOTICE 'Materialized views created:';
+    RAISE NOTICE '  - mv_street_lights_enriched';
+    RAISE NOTICE '  - mv_neighborhood_stats';
+    RAISE NOTICE '  - mv_faulty_lights_with_supplier';
+    RAISE NOTICE '  - mv_seasonal_patterns';
     RAISE NOTICE 'Helper functions created:';
     RAISE NOTICE '  - get_nearest_supplier(light_id) - Find nearest supplier to a light';
+    RAISE NOTICE '  - refresh_enriched_lights(force) - Refresh the enriched lights snapshot';
 END $$;
 
 
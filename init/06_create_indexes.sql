@@ -22,14 +22,26 @@ SET search_path TO streetlights, public;
 CREATE INDEX IF NOT EXISTS idx_lights_location ON streetlights.street_lights USING GIST(location);
 COMMENT ON INDEX streetlights.idx_lights_location IS 'Spatial index for fast proximity and containment queries';
 
+-- Spatial index on street_lights geography (metre radius and KNN queries)
+CREATE INDEX IF NOT EXISTS idx_lights_location_geog ON streetlights.street_lights USING GIST(location_geog);
+COMMENT ON INDEX streetlights.idx_lights_location_geog IS 'Geography index for distance queries on location_geog';
+
 -- Spatial index on neighborhoods boundary
 CREATE INDEX IF NOT EXISTS idx_neighborhoods_boundary ON streetlights.neighborhoods USING GIST(boundary);
 COMMENT ON INDEX streetlights.idx_neighborhoods_boundary IS 'Spatial index for fast point-in-polygon queries';
 
+-- Spatial index on neighborhood centers
+CREATE INDEX IF NOT EXISTS idx_neighborhoods_center ON streetlights.neighborhoods USING GIST(center);
+COMMENT ON INDEX streetlights.idx_neighborhoods_center IS 'Geography index on stored neighborhood centroids';
+
 -- Spatial index on suppliers location
 CREATE INDEX IF NOT EXISTS idx_suppliers_location ON streetlights.suppliers USING GIST(location);
 COMMENT ON INDEX streetlights.idx_suppliers_location IS 'Spatial index for nearest supplier queries';
 
+-- Spatial index on suppliers geography (KNN ordering by true distance)
+CREATE INDEX IF NOT EXISTS idx_suppliers_location_geog ON streetlights.suppliers USING GIST(location_geog);
+COMMENT ON INDEX streetlights.idx_suppliers_location_geog IS 'Geography index for nearest supplier KNN queries';
+
 -- Regular B-tree indexes for foreign keys and common filters
 CREATE INDEX IF NOT EXISTS idx_lights_status ON streetlights.street_lights(status);
 COMMENT ON INDEX streetlights.idx_lights_status IS 'Fast filtering by light status (operational, faulty, maintenance_required)';
@@ -52,6 +64,10 @@ COMMENT ON INDEX streetlights.idx_weather_season IS 'Fast filtering by season';
 CREATE INDEX IF NOT EXISTS idx_power_grid_light ON streetlights.power_grid_enrichment(light_id);
 COMMENT ON INDEX streetlights.idx_power_grid_light IS 'Fast JOIN for enrichment';
 
+-- Partial index for the dashboard's faulty-light filter
+CREATE INDEX IF NOT EXISTS idx_lights_faulty ON streetlights.street_lights(light_id) WHERE status = 'faulty';
+COMMENT ON INDEX streetlights.idx_lights_faulty IS 'Small index over faulty lights only (faulty lights analysis)';
+
 -- Analyze tables for query optimizer
 ANALYZE streetlights.neighborhoods;
 ANALYZE streetlights.street_lights;
@@ -73,8 +89,11 @@ BEGIN
     RAISE NOTICE 'Indexes created successfully!';
     RAISE NOTICE 'Spatial indexes (GIST):';
     RAISE NOTICE '  - idx_lights_location';
+    RAISE NOTICE '  - idx_lights_location_geog';
     RAISE NOTICE '  - idx_neighborhoods_boundary';
+    RAISE NOTICE '  - idx_neighborhoods_center';
     RAISE NOTICE '  - idx_suppliers_location';
+    RAISE NOTICE '  - idx_suppliers_location_geog';
     RAISE NOTICE 'Regular indexes (B-tree):';
     RAISE NOTICE '  - idx_lights_status';
     RAISE NOTICE '  - idx_lights_neighborhood';
@@ -83,6 +102,8 @@ BEGIN
     RAISE NOTICE '  - idx_weather_light';
     RAISE NOTICE '  - idx_weather_season';
     RAISE NOTICE '  - idx_power_grid_light';
+    RAISE NOTICE 'Partial indexes (B-tree):';
+    RAISE NOTICE '  - idx_lights_faulty';
     RAISE NOTICE 'Total indexes in streetlights schema: %', idx_count;
     RAISE NOTICE 'Tables analyzed for query optimization';
 END $$;
@@ -13,10 +13,19 @@
 -- limitations under the License.
 
 -- Create PostgreSQL publication for Snowflake Openflow CDC
--- This publication makes all streetlights schema tables available for Change Data Capture
+-- This publication makes the streetlights source tables available for Change Data Capture
 
--- Create publication for all tables in the streetlights schema
-CREATE PUBLICATION streetlights_publication FOR TABLES IN SCHEMA streetlights;
+-- Tables are listed explicitly so derived tables are not replicated:
+-- light_nearest_supplier is rebuilt from street_lights and suppliers, and a
+-- single supplier change can rewrite thousands of its rows
+CREATE PUBLICATION streetlights_publication FOR TABLE
+    streetlights.neighborhoods,
+    streetlights.street_lights,
+    streetlights.maintenance_requests,
+    streetlights.suppliers,
+    streetlights.weather_enrichment,
+    streetlights.demographics_enrichment,
+    streetlights.power_grid_enrichment;
 
 -- Verify publication
 SELECT pubname, puballtables, pubinsert, pubupdate, pubdelete 